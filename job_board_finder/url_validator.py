@@ -10,6 +10,7 @@ from typing import List, Dict
 import time
 from pathlib import Path
 import re
+from urllib.parse import urlparse
 
 class AvatureURLValidator:
     """Validates and categorizes potential Avature career sites"""
@@ -31,6 +32,9 @@ class AvatureURLValidator:
             'Sec-Fetch-User': '?1',
             'DNT': '1'
         })
+        # Probe results keyed by netloc, so URLs sharing a host are only checked once
+        self._sitemap_cache: Dict[str, bool] = {}
+        self._rss_cache: Dict[str, bool] = {}
     
     def validate_urls(self, urls: List[str]) -> Dict:
         """
@@ -178,7 +182,6 @@ class AvatureURLValidator:
     
     def _is_same_domain(self, url1: str, url2: str) -> bool:
         """Check if two URLs are from the same domain"""
-        from urllib.parse import urlparse
         domain1 = urlparse(url1).netloc
         domain2 = urlparse(url2).netloc
         return domain1 == domain2
@@ -232,22 +235,36 @@ class AvatureURLValidator:
             return 0
     
     def _check_sitemap(self, base_url: str) -> bool:
-        """Check if sitemap exists"""
+        """Check if sitemap exists (cached per host)"""
+        host = urlparse(base_url).netloc
+        if host in self._sitemap_cache:
+            return self._sitemap_cache[host]
+        
         sitemap_url = f"{base_url}/sitemap.xml"
         try:
             resp = self.session.get(sitemap_url, timeout=5)
-            return resp.status_code == 200
+            has_sitemap = resp.status_code == 200
         except:
-            return False
+            has_sitemap = False
+        
+        self._sitemap_cache[host] = has_sitemap
+        return has_sitemap
     
     def _check_rss(self, base_url: str) -> bool:
-        """Check if RSS feed exists"""
+        """Check if RSS feed exists (cached per host)"""
+        host = urlparse(base_url).netloc
+        if host in self._rss_cache:
+            return self._rss_cache[host]
+        
         rss_url = f"{base_url}/SearchJobs/feed/"
         try:
             resp = self.session.get(rss_url, timeout=5)
-            return resp.status_code == 200 and 'xml' in resp.headers.get('Content-Type', '')
+            has_rss = resp.status_code == 200 and 'xml' in resp.headers.get('Content-Type', '')
         except:
-            return False
+            has_rss = False
+        
+        self._rss_cache[host] = has_rss
+        return has_rss
 
 
 def load_urls_from_file(filepath: str) -> List[str]:
@@ -7,16 +7,28 @@ Demonstrates comprehensive discovery and implements all fallback strategies:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass, fields as dataclass_fields
+from datetime import datetime, timezone
 import time
 import json
 import re
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import atexit
+import copy
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, Future
+import functools
+import html as html_lib
 import logging
+import os
+import tempfile
+import threading
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 
@@ -33,8 +45,187 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logger.warning("Playwright not available. Install with: pip install playwright")
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.debug("selectolax not available, listing pages will be parsed with BeautifulSoup")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug("orjson not available, results will be written with the json module")
+
+# urlparse memoized: the same base and job URLs are parsed again across
+# domain checks, application URL resolution and company loading
+_urlparse = functools.lru_cache(maxsize=8192)(urlparse)
+
+# Buffer size for output files, so large result files go out in few writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Characters stripped from company names before they go into file names
+_UNSAFE_NAME_CHARS_RE = re.compile(r'[^\w\s-]')
+
+# Marks base URL resolution errors caused by a redirect off Avature
+_EXTERNAL_REDIRECT_PREFIX = 'external_redirect: '
+
+# Minimum per-host connection pool size
+_POOL_SIZE = 32
+
+# Delay between listing page requests: starts at the old fixed 3s spacing, doubles
+# when throttled and comes down one step after each run of clean pages
+_PAGE_DELAY_INITIAL = 3.0
+_PAGE_DELAY_MIN = 1.0
+_PAGE_DELAY_MAX = 10.0
+_PAGE_DELAY_STEP = 0.25
+_PAGE_DELAY_CLEAN_RUN = 10
+
+# A listing page throttled with 406/429 is retried this many times before it is
+# recorded for a later run. Without a Retry-After header the waits follow Avature's
+# 406 cooldown: 60s, 120s, 240s, then 300s
+_PAGE_THROTTLE_MAX_RETRIES = 5
+_PAGE_THROTTLE_BASE_BACKOFF = 60
+_PAGE_THROTTLE_MAX_BACKOFF = 300
+
+# Hosts whose career sites sit behind an AWS WAF JavaScript challenge
+_AWS_WAF_PROTECTED_DOMAINS = ('koch', 'sandboxlululemoninc')
+
+# On-disk cache of search page validators and the values parsed from them
+_SEARCH_CACHE_FILE = Path.home() / '.cache' / 'avature_scraper' / 'search_pages.json'
+
+# Leading bytes of a job detail page checked for closed/filled banners
+# before the rest of the body is downloaded
+_DETAIL_PREFIX_BYTES = 256 * 1024
+
+# Job containers on listing pages across the known Avature layouts, tried in order
+# (standard articles, list items, DeloitteBE table cards and sandboxbnc-style table rows)
+_JOB_CONTAINER_SELECTORS = (
+    'article.article--result',
+    'li:has(a[href*="/JobDetail/"]), li:has(a[href*="/FolderDetail/"]), li:has(a[href*="/PipelineDetail/"])',
+    'tr.card--box',
+    'tr:has(a[href*="/JobDetail/"]), tr:has(a[href*="/FolderDetail/"]), tr:has(a[href*="/PipelineDetail/"])',
+)
+_JOB_LINK_SELECTOR = 'a[href*="/JobDetail/"], a[href*="/FolderDetail/"], a[href*="/PipelineDetail/"]'
+
+# Numeric job ID at the end of a detail URL; same value _extract_job_id returns
+_JOB_ID_RE = re.compile(r'/(?:JobDetail|FolderDetail|PipelineDetail)/(?:[^/?#]*/)?(\d+)/?(?:[?#]|$)')
+
+# Raw job hrefs for --fast mode, matched directly on the response bytes
+_FAST_HREF_RE = re.compile(rb'href="([^"]*/(?:JobDetail|FolderDetail|PipelineDetail)/[^"]+)"')
+
+# Markers that identify the pagination parameter style of a search page
+_PAGINATION_STYLE_RE = re.compile(rb'pipelineRecordsPerPage|PipelineDetail|folderRecordsPerPage|FolderDetail')
+
+# Elements that may hold the total job count, in order of preference
+_JOB_COUNT_SELECTORS = (
+    'div.list-controls__legend',  # Updated selector
+    'div.list-controls__text__legend',  # Fallback
+    '.list-controls__legend',
+    '.search__panel__count--span',  # New selector for amswh format
+    '.pagination__legend',  # New selector for ashfieldhealthcare format
+    '.legend',
+    '.section__title--3'  # Koch-specific selector for "999+" jobs
+)
+
+
+def _job_count_legend_re(selector: str) -> re.Pattern:
+    """
+    Raw-bytes form of a 'tag.class' / '.class' legend selector: the first such
+    element, its leading text, and a '/' when that text runs to a closing tag
+    (no nested markup)
+    """
+    tag, _, css_class = selector.partition('.')
+    return re.compile(
+        rb'<' + (re.escape(tag.encode()) if tag else rb'[a-zA-Z][\w-]*') +
+        rb'(?=\s)[^>]*?\sclass="(?:[^"]*\s)?' + re.escape(css_class.encode()) +
+        rb'(?:\s[^"]*)?"[^>]*>([^<]*)<(/?)'
+    )
 
-@dataclass
+
+# (class name, pattern) per _JOB_COUNT_SELECTORS entry, in the same order
+_JOB_COUNT_LEGEND_RES = tuple(
+    (selector.partition('.')[2].encode(), _job_count_legend_re(selector)) for selector in _JOB_COUNT_SELECTORS
+)
+
+# Job count patterns for the legend text, tried in order
+_JOB_COUNT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'Showing\s+\d+-\d+\s+of\s+(\d+)\+?',  # "Showing 1-10 of 106 results" or "999+ results"
+    r'There\s+are\s+(\d+)\+?\s+jobs\s+matching',  # "There are 80 jobs matching" or "999+ jobs matching"
+    r'of\s+(\d+)\+?\s+results',  # "of 106 results" or "999+ results"
+    r'of\s+(\d+)\+?',  # "of 106" or "999+"
+    r'(\d+)\+?\s+results',  # "106 results" or "999+ results"
+    r'(\d+)\+?\s+jobs',  # "80 jobs" or "999+ jobs"
+    r'^(\d+)\+$',  # Direct "999+" pattern (whole text)
+    r'(\d+)\+',  # Direct "999+" pattern (anywhere)
+    r'(\d+)\s*available\s*positions?',  # "999 available positions"
+    r'(\d+)\s*open\s*positions?',  # "999 open positions"
+)]
+
+# Job detail pages that are no longer open, matched on the raw response bytes
+_CLOSED_JOB_RE = re.compile(rb'position has been filled|no longer accepting applications|this job posting has expired', re.IGNORECASE)
+_CLOSED_JOB_REASONS = {
+    b'position has been filled': ('position_filled', 'Job page indicates position has been filled', 'Position filled'),
+    b'no longer accepting applications': ('applications_closed', 'Job page indicates applications are no longer accepted', 'Applications closed'),
+    b'this job posting has expired': ('job_expired', 'Job posting has expired', 'Job expired'),
+}
+
+# Structured field labels on job detail pages and the Job attribute they fill
+_LABEL_MAP = {
+    'posted date': 'date_posted',
+    'date posted': 'date_posted',
+    'employment type': 'employment_type',
+    'job type': 'employment_type',
+    'business area': 'department',
+    'department': 'department',
+    'division': 'department',
+    'location': 'location',
+}
+# Substring fallback for labels not in the map ("Work Location", "Posted Date:")
+_LABEL_SUBSTRINGS = (
+    ('Posted Date', 'date_posted'),
+    ('Date Posted', 'date_posted'),
+    ('Employment Type', 'employment_type'),
+    ('Job Type', 'employment_type'),
+    ('Business Area', 'department'),
+    ('Department', 'department'),
+    ('Division', 'department'),
+)
+
+# Content elements kept when parsing job detail pages; drops <head>, top-level
+# scripts, styles and other chrome (matched elements keep all their descendants)
+_JOB_PAGE_STRAINER = SoupStrainer(['h1', 'h2', 'a', 'span', 'div', 'p', 'time'])
+
+# Selector fallbacks for job detail metadata and the apply link, in priority order
+_DATE_SELECTORS = ('span.date-posted', 'time', 'span[class*="date"]')
+_DEPARTMENT_SELECTORS = ('span.department', 'span.category', 'div[class*="department"]')
+_APPLY_SELECTORS = (
+    'a.button.button--primary',  # Primary apply button
+    'a[href*="Login?jobId"]',  # Avature login-based application
+    'a[href*="Apply"]',
+    'a[data-map="apply-button"]',
+    'a.apply-button'
+)
+# Lowercase href fragments that mark a link as an application link
+_APPLY_KEYWORDS = ('apply', 'login?jobid', 'application')
+
+# Class names for the department fallback on job detail pages
+_DEPARTMENT_CLASS_RE = re.compile(r'department|category')
+
+# Job detail page text patterns
+_WORK_LOCATION_RE = re.compile(r'Work Location[:\s]*([^\n]+)', re.IGNORECASE)
+_LOCATION_RE = re.compile(r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,})')
+_NAV_BUTTON_TEXT_RE = re.compile(r'Apply\s*Now|Back\s*to|Log\s*In|Save\s*this\s*Job', re.IGNORECASE)
+_BUTTON_CLASS_RE = re.compile(r'button')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Only job links and the container tags _JOB_CONTAINER_SELECTORS looks for need to be built
+_JOB_STRAINER = SoupStrainer(['article', 'li', 'tr', 'a'])
+
+
+@dataclass(slots=True)
 class URLFailure:
     """Failed URL collection record"""
     url: str
@@ -50,7 +241,7 @@ class URLFailure:
             self.timestamp = datetime.utcnow().isoformat()
 
 
-@dataclass 
+@dataclass(slots=True)
 class URLSuccess:
     """Successful URL collection record"""
     url: str
@@ -64,7 +255,7 @@ class URLSuccess:
             self.timestamp = datetime.utcnow().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class JobFailure:
     """Failed job extraction record"""
     url: str
@@ -80,7 +271,7 @@ class JobFailure:
             self.timestamp = datetime.utcnow().isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job posting data model"""
     job_id: str
@@ -116,12 +307,21 @@ class AvatureMultiStrategyScraper:
     3. Track RSS feed availability for documentation purposes
     """
     
-    def __init__(self, company_name: str, base_url: str, max_workers: int = 5):
+    # Headless browser reused across WAF challenge solves, one per thread since
+    # Playwright's sync API is bound to the thread that started it
+    _browser_local = threading.local()
+    
+    # Parsed search page values keyed by URL, revalidated with ETag/Last-Modified
+    _search_cache = None
+    _search_cache_lock = threading.Lock()
+    
+    def __init__(self, company_name: str, base_url: str, max_workers: int = 5, fast_mode: bool = False):
         self.company_name = company_name
         self.original_base_url = base_url.rstrip('/')
         self.max_workers = max_workers  # Reduced from 10 to 5 for better rate limiting
+        self.fast_mode = fast_mode  # Regex-only listing page extraction
         
-        parsed = urlparse(base_url)
+        parsed = _urlparse(base_url)
         self.domain = f"{parsed.scheme}://{parsed.netloc}"
         
         self.session = requests.Session()
@@ -134,6 +334,35 @@ class AvatureMultiStrategyScraper:
             'Upgrade-Insecure-Requests': '1',
         })
         
+        # Keep enough pooled keep-alive connections for every worker, and let urllib3
+        # retry transient errors (honoring Retry-After) before we see the response
+        pool_size = max(_POOL_SIZE, self.max_workers * 2)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Adaptive delay between listing pages, see _update_rate_delay
+        self._rate_delay = _PAGE_DELAY_INITIAL
+        self._consecutive_ok = 0
+        # Next free start time for a listing page request, shared with prefetch threads
+        self._next_page_slot = 0.0
+        self._page_slot_lock = threading.Lock()
+        
+        # (page size key, offset key) for this site, see _get_pagination_params
+        self._pagination_keys: Optional[Tuple[str, str]] = None
+        # Page size and parameter style read from the default search page
+        self._probe_result: Optional[Dict] = None
+        
         # URL collection tracking
         self.successes: List[URLSuccess] = []
         self.retries: List[URLFailure] = []
@@ -143,6 +372,11 @@ class AvatureMultiStrategyScraper:
         self.strategy_used = None
         self.rss_available = False
         
+        # Site quirks, decided once from the configured URL
+        self._base_url_lower = self.original_base_url.lower()
+        self._is_koch = 'koch' in self._base_url_lower
+        self._needs_waf = any(domain in self._base_url_lower for domain in _AWS_WAF_PROTECTED_DOMAINS)
+        
         # Resolve actual base URL by following redirects
         self.base_url = self._resolve_base_url()
         
@@ -158,19 +392,15 @@ class AvatureMultiStrategyScraper:
         Avature sites should have 'avature.net' as the domain or subdomain
         Secure check to prevent subdomain attacks like 'avature.net.evil.com'
         """
-        parsed = urlparse(url)
+        parsed = _urlparse(url)
         domain = parsed.netloc.lower()
         
         # Check if domain ends with '.avature.net' or is exactly 'avature.net'
         return domain == 'avature.net' or domain.endswith('.avature.net')
     
-    def _is_aws_waf_protected(self, url: str) -> bool:
-        """Check if a site is protected by AWS WAF by looking for challenge responses"""
-        try:
-            resp = self.session.get(url, timeout=10)
-            return resp.status_code == 202 and 'x-amzn-waf-action' in resp.headers
-        except:
-            return False
+    def _is_aws_waf_protected(self, resp: requests.Response) -> bool:
+        """Check if a response is an AWS WAF challenge"""
+        return resp.status_code == 202 and 'x-amzn-waf-action' in resp.headers
     
     def _resolve_base_url(self) -> str:
         """
@@ -180,20 +410,25 @@ class AvatureMultiStrategyScraper:
         """
         try:
             # Check if site needs AWS WAF authentication
-            aws_waf_protected_domains = ['koch', 'sandboxlululemoninc']
-            needs_waf_auth = any(domain in self.original_base_url.lower() for domain in aws_waf_protected_domains)
+            needs_waf_auth = self._needs_waf
             
-            if needs_waf_auth or self._is_aws_waf_protected(self.original_base_url):
+            if needs_waf_auth:
                 self._get_aws_waf_token()
                 
             # For Koch and other AWS WAF-protected sites, set up authentication first
-            if 'koch' in self.original_base_url.lower():
+            if self._is_koch:
                 # Koch specifically redirects to /en_US/careers
                 return "https://koch.avature.net/en_US/careers"
             
             # Try the original URL first for other sites
             resp = self.session.get(self.original_base_url, timeout=10, allow_redirects=True)
             
+            # Other WAF-protected sites give themselves away on this request,
+            # so there is no need for a separate probe up front
+            if not needs_waf_auth and self._is_aws_waf_protected(resp):
+                self._get_aws_waf_token()
+                resp = self.session.get(self.original_base_url, timeout=10, allow_redirects=True)
+            
             # Check if we were redirected to a non-Avature domain regardless of status code
             final_url = resp.url.rstrip('/')
             if final_url != self.original_base_url:
@@ -203,7 +438,7 @@ class AvatureMultiStrategyScraper:
                 if not self._is_avature_domain(final_url):
                     error_msg = f"Site redirected to non-Avature domain: {final_url}"
                     logger.error(error_msg)
-                    raise Exception(f"external_redirect: {error_msg}")
+                    raise Exception(f"{_EXTERNAL_REDIRECT_PREFIX}{error_msg}")
             
             if resp.status_code in [200, 202]:  # Accept both 200 and 202 status codes
                 return final_url
@@ -218,7 +453,7 @@ class AvatureMultiStrategyScraper:
                     return self.original_base_url
         except Exception as e:
             # If it's our external redirect exception, re-raise it
-            if "external_redirect:" in str(e):
+            if _EXTERNAL_REDIRECT_PREFIX in str(e):
                 raise
             logger.warning(f"Error resolving base URL {self.original_base_url}: {e}, using as-is")
             return self.original_base_url
@@ -232,14 +467,14 @@ class AvatureMultiStrategyScraper:
             # This will raise an exception if redirected to non-Avature domain
             resolved_url = self.base_url
         except Exception as e:
-            if "external_redirect:" in str(e):
+            if _EXTERNAL_REDIRECT_PREFIX in str(e):
                 # Log the redirect failure
                 failure = URLFailure(
                     url=self.original_base_url,
                     company=self.company_name,
                     source='redirect_check',
                     error_type='external_redirect',
-                    error_message=str(e).replace("external_redirect: ", "")
+                    error_message=str(e).replace(_EXTERNAL_REDIRECT_PREFIX, "")
                 )
                 self.failures.append(failure)
                 self._save_failures()
@@ -304,7 +539,7 @@ class AvatureMultiStrategyScraper:
                 html_urls = self._scrape_via_html_pagination(sitemap_job_ids, total_jobs_html)
                 
                 # Combine and deduplicate all URLs by job ID
-                all_urls = self._deduplicate_urls(sitemap_urls + html_urls)
+                all_urls = self._deduplicate_urls(sitemap_urls, html_urls)
                 self.strategy_used = "sitemap_plus_html"
             else:
                 logger.info(f"✓ No gaps detected - sitemap appears complete\n")
@@ -328,8 +563,8 @@ class AvatureMultiStrategyScraper:
             try:
                 resp = self.session.get(rss_url, timeout=10)
                 if resp.status_code == 200 and 'xml' in resp.headers.get('Content-Type', '').lower():
-                    soup = BeautifulSoup(resp.content, 'xml')
-                    items = soup.find_all('item')
+                    # Feeds are capped at ~20 items, so a plain tree is cheaper than streaming
+                    items = etree.fromstring(resp.content).findall('.//item')
                     if items:
                         return len(items)
             except:
@@ -359,39 +594,51 @@ class AvatureMultiStrategyScraper:
         logger.info(f"✓ Found {len(job_urls)} job URLs in sitemap")
         logger.info(f"Processing URLs and extracting job IDs...\n")
         
-        job_ids = set()
+        # Extract all job IDs in one pass, then record the outcomes in bulk
+        results = [self._safe_extract_id(url) for url in job_urls]
+        extracted = [(url, job_id) for url, job_id, error in results if error is None]
+        failed = [(url, error) for url, job_id, error in results if error is not None]
         
-        # Process each URL from sitemap
-        for url in job_urls:
-            try:
-                job_id = self._extract_job_id(url)
-                
-                # Record successful URL collection
-                success = URLSuccess(
-                    url=url,
-                    job_id=job_id,
-                    company=self.company_name,
-                    source='sitemap'
-                )
-                self.successes.append(success)
-                job_ids.add(job_id)
-                
-            except Exception as e:
-                logger.debug(f"Error processing sitemap URL {url}: {e}")
-                failure = URLFailure(
-                    url=url,
-                    company=self.company_name,
-                    source='sitemap',
-                    error_type='parse_error',
-                    error_message=f'Failed to extract job ID: {str(e)}'
-                )
-                self.failures.append(failure)
+        # One timestamp for the whole sitemap batch
+        now = datetime.utcnow().isoformat()
+        
+        self.successes.extend(
+            URLSuccess(
+                url=url,
+                job_id=job_id,
+                company=self.company_name,
+                source='sitemap',
+                timestamp=now
+            )
+            for url, job_id in extracted
+        )
+        self.failures.extend(
+            URLFailure(
+                url=url,
+                company=self.company_name,
+                source='sitemap',
+                error_type='parse_error',
+                error_message=f'Failed to extract job ID: {error}',
+                timestamp=now
+            )
+            for url, error in failed
+        )
+        job_ids = {job_id for url, job_id in extracted}
         
-        success_urls = [s.url for s in self.successes if s.source == 'sitemap']
-        logger.info(f"Sitemap processing: {len(success_urls)} URLs collected, {len([f for f in self.failures if f.source == 'sitemap'])} failures\n")
+        # Report from this batch rather than rescanning every recorded success/failure
+        success_urls = [url for url, job_id in extracted]
+        logger.info(f"Sitemap processing: {len(success_urls)} URLs collected, {len(failed)} failures\n")
         
         return success_urls, job_ids
     
+    def _safe_extract_id(self, url: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Extract a job ID without raising. Returns: (url, job_id, error_message)"""
+        try:
+            return url, self._extract_job_id(url), None
+        except Exception as e:
+            logger.debug(f"Error processing sitemap URL {url}: {e}")
+            return url, None, str(e)
+    
     def _check_html_sample(self, existing_job_ids: Set[str], pages: int = 3) -> List[str]:
         """
         Check first N pages of HTML for URLs not in sitemap
@@ -401,10 +648,14 @@ class AvatureMultiStrategyScraper:
         page_size = self._detect_page_size()
         search_url = f"{self.base_url}/SearchJobs/"
         
+        # Resolve the parameter style once; only the offset changes per page
+        base_params = self._get_pagination_params(page_size, 0)
+        offset_key = next(key for key in base_params if key.endswith('Offset'))
+        
         for page_num in range(1, pages + 1):
             try:
                 offset = (page_num - 1) * page_size
-                params = self._get_pagination_params(page_size, offset)
+                params = {**base_params, offset_key: offset}
                 resp = self.session.get(search_url, params=params, timeout=10)
                 
                 # Handle HTTP errors for sample check
@@ -416,49 +667,14 @@ class AvatureMultiStrategyScraper:
                     logger.debug(f"HTTP {resp.status_code} during sample check on page {page_num}")
                     break
                 
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                
-                # Find job containers - try multiple structures
-                articles = soup.find_all('article', class_='article--result')
-                
-                # If no standard articles, try alternatives
-                if not articles:
-                    # Try li elements that actually contain job links (most reliable)
-                    all_lis = soup.find_all('li')
-                    list_items = [li for li in all_lis if li.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                    
-                    if list_items:
-                        logger.debug(f"Found {len(list_items)} jobs using list structure")
-                        articles = list_items
-                    else:
-                        # Try table rows with specific class first (DeloitteBE style)
-                        table_rows = soup.find_all('tr', class_='card--box')
-                        if table_rows:
-                            articles = table_rows
-                        else:
-                            # Try any table rows that contain job links (sandboxbnc style)
-                            all_trs = soup.find_all('tr')
-                            table_job_rows = [tr for tr in all_trs if tr.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                            if table_job_rows:
-                                logger.debug(f"Found {len(table_job_rows)} jobs using table row structure")
-                                articles = table_job_rows
-                            else:
-                                div_jobs = soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
-                                if div_jobs:
-                                    articles = div_jobs
+                job_links = self._find_job_links(resp.content)
                 
-                if not articles:
+                if not job_links:
                     break
                 
-                for article in articles:
+                for job_url in job_links:
                     try:
-                        link = article.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))
-                        if not link:
-                            continue
-                        
-                        job_url = link.get('href')
-                        if not job_url.startswith('http'):
-                            job_url = urljoin(self.domain, job_url)
+                        job_url = self._absolute_url(job_url)
                         
                         job_id = self._extract_job_id(job_url)
                         
@@ -489,21 +705,21 @@ class AvatureMultiStrategyScraper:
         logger.info("-" * 60)
         
         # For AWS WAF-protected sites, get auth token first
-        aws_waf_protected_domains = ['koch', 'sandboxlululemoninc']
-        if any(domain in self.base_url.lower() for domain in aws_waf_protected_domains):
+        needs_waf_auth = self._needs_waf
+        if needs_waf_auth:
             self._get_aws_waf_token()
         
         urls = []
         page_num = 1
         offset = 0
-        retry_attempt = 0
+        throttle_attempts = 0
         
         # Detect page size
         page_size = self._detect_page_size()
         logger.info(f"Detected page size: {page_size} jobs per page")
         
         # Use Koch-specific URL format if needed
-        if 'koch' in self.base_url.lower():
+        if self._is_koch:
             search_url = "https://koch.avature.net/en_US/careers/SearchJobs/"
             referer = "https://koch.avature.net/en_US/careers"
         else:
@@ -523,29 +739,63 @@ class AvatureMultiStrategyScraper:
             'Sec-Fetch-Site': 'same-origin',
         }
         
+        # Resolve the parameter style once; only the offset changes per page
+        base_params = self._get_pagination_params(page_size, 0)
+        # Add listFilterMode parameter like in the working curl
+        base_params['listFilterMode'] = 1
+        offset_key = next(key for key in base_params if key.endswith('Offset'))
+        
+        # Futures for the next few pages, keyed by offset. Prefetches take pacing
+        # slots like any other page request, so they overlap latency without
+        # bursting, and stop as soon as the host throttles us. WAF-protected sites
+        # stay strictly sequential to keep their challenge cookies valid
+        prefetched = {}
+        prefetch_stop = threading.Event()
+        last_offset = None
+        prefetch_window = 0 if needs_waf_auth else self.max_workers
+        
         if total_expected:
             estimated_pages = (total_expected + page_size - 1) // page_size
             logger.info(f"Estimated pages needed: {estimated_pages}\n")
+            last_offset = (estimated_pages - 1) * page_size
+        
+        prefetcher = ThreadPoolExecutor(max_workers=max(1, prefetch_window))
         
         while True:
             try:
-                params = self._get_pagination_params(page_size, offset)
-                # Add listFilterMode parameter like in the working curl
-                params['listFilterMode'] = 1
+                params = {**base_params, offset_key: offset}
+                resp = None
+                future = prefetched.pop(offset, None)
+                if future is not None:
+                    try:
+                        resp = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.debug(f"Prefetch failed for offset {offset}, fetching it again: {e}")
                 
-                resp = self.session.get(search_url, params=params, headers=headers, timeout=15)
+                if resp is None:
+                    resp = self._paced_listing_get(search_url, params, headers)
                 
-                # Handle HTTP errors (group 406 and 429 together)
-                if resp.status_code in [406, 429]:
-                    retry_attempt += 1
-                    if retry_attempt > 5:  # Max 5 retries per page
-                        logger.error(f"Max retries exceeded for page {page_num}, moving to next")
-                        break
-                    delay = min(60 * (2 ** (retry_attempt - 1)), 300)  # 60s, 120s, 240s, max 300s
-                    error_name = "HTTP 406" if resp.status_code == 406 else "Rate limit (429)"
-                    logger.warning(f"{error_name} on page {page_num} (attempt {retry_attempt}), waiting {delay}s...")
-                    time.sleep(delay)
-                    continue  # Retry the same page
+                # Avature answers bursts with 406 (429s left over after the session
+                # adapter's Retry-After handling get the same treatment): back off and
+                # retry the same page
+                throttled = resp.status_code in [406, 429]
+                self._update_rate_delay(throttled=throttled)
+                if throttled:
+                    # Queued prefetches are dropped; running ones give up after their pacing wait
+                    prefetch_stop.set()
+                    for pending in prefetched.values():
+                        pending.cancel()
+                    prefetched.clear()
+                    
+                    throttle_attempts += 1
+                    if throttle_attempts <= _PAGE_THROTTLE_MAX_RETRIES:
+                        delay = self._retry_after_seconds(resp)
+                        if delay is None:
+                            delay = min(_PAGE_THROTTLE_BASE_BACKOFF * 2 ** (throttle_attempts - 1), _PAGE_THROTTLE_MAX_BACKOFF)
+                        logger.warning(f"HTTP {resp.status_code} on page {page_num} (attempt {throttle_attempts}), waiting {delay:.0f}s...")
+                        time.sleep(delay)
+                        continue
+                    logger.error(f"Max retries exceeded for page {page_num}")
                 
                 if resp.status_code not in [200, 202]:
                     logger.warning(f"HTTP {resp.status_code} on page {page_num}")
@@ -553,64 +803,46 @@ class AvatureMultiStrategyScraper:
                         url=f"{search_url}?{params}",
                         company=self.company_name,
                         source='html',
-                        error_type='http_error',
+                        error_type='rate_limited' if resp.status_code in [406, 429] else 'http_error',
                         error_message=f'HTTP {resp.status_code}',
                         http_status=resp.status_code
                     )
-                    self.failures.append(failure)
+                    # Rate-limited pages are worth another run later, anything else is permanent
+                    if resp.status_code in [406, 429]:
+                        self.retries.append(failure)
+                    else:
+                        self.failures.append(failure)
                     break
                 
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                
-                # Extract job URLs from this page - try multiple HTML structures
-                articles = soup.find_all('article', class_='article--result')
+                # Keep the next pages in flight while this one is handled, unless
+                # this page only came through after throttling
+                if prefetch_window and last_offset is not None and throttle_attempts == 0:
+                    if prefetch_stop.is_set():
+                        prefetch_stop = threading.Event()
+                    for ahead in range(1, prefetch_window + 1):
+                        next_offset = offset + ahead * page_size
+                        if next_offset > last_offset:
+                            break
+                        if next_offset not in prefetched:
+                            prefetched[next_offset] = prefetcher.submit(
+                                self._paced_listing_get, search_url, {**base_params, offset_key: next_offset},
+                                headers, prefetch_stop
+                            )
                 
-                # If no standard articles found, try alternative structures
-                if not articles:
-                    # First try to find li elements that actually contain job links
-                    all_lis = soup.find_all('li')
-                    list_items = [li for li in all_lis if li.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                    
-                    if list_items:
-                        logger.debug(f"Found {len(list_items)} jobs using list structure")
-                        articles = list_items
-                    else:
-                        # Try table rows with specific class first (DeloitteBE style)
-                        table_rows = soup.find_all('tr', class_='card--box')
-                        if table_rows:
-                            logger.debug(f"Found {len(table_rows)} jobs using table structure (DeloitteBE style)")
-                            articles = table_rows
-                        else:
-                            # Try any table rows that contain job links (sandboxbnc style)
-                            all_trs = soup.find_all('tr')
-                            table_job_rows = [tr for tr in all_trs if tr.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                            if table_job_rows:
-                                logger.debug(f"Found {len(table_job_rows)} jobs using table row structure (sandboxbnc style)")
-                                articles = table_job_rows
-                            else:
-                                # Other possible alternative structures
-                                div_jobs = soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
-                                if div_jobs:
-                                    logger.debug(f"Found {len(div_jobs)} jobs using div structure")
-                                    articles = div_jobs
+                job_links = self._find_job_links(resp.content)
                 
-                if not articles:
+                if not job_links:
                     logger.info(f"No more jobs found on page {page_num}")
                     break
                 
-                logger.info(f"Page {page_num}: Found {len(articles)} jobs")
+                logger.info(f"Page {page_num}: Found {len(job_links)} jobs")
                 
+                # Records from the same page share one timestamp
+                now = datetime.utcnow().isoformat()
                 new_urls_count = 0
-                for article in articles:
+                for job_url in job_links:
                     try:
-                        # Get job URL - support multiple Avature URL patterns
-                        link = article.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))
-                        if not link:
-                            continue
-                        
-                        job_url = link.get('href')
-                        if not job_url.startswith('http'):
-                            job_url = urljoin(self.domain, job_url)
+                        job_url = self._absolute_url(job_url)
                         
                         # Extract job ID
                         job_id = self._extract_job_id(job_url)
@@ -624,7 +856,8 @@ class AvatureMultiStrategyScraper:
                             url=job_url,
                             job_id=job_id,
                             company=self.company_name,
-                            source='html'
+                            source='html',
+                            timestamp=now
                         )
                         self.successes.append(success)
                         urls.append(job_url)
@@ -638,22 +871,20 @@ class AvatureMultiStrategyScraper:
                             company=self.company_name,
                             source='html',
                             error_type='parse_error',
-                            error_message=f'Failed to extract URL from article: {str(e)}'
+                            error_message=f'Failed to extract URL from article: {str(e)}',
+                            timestamp=now
                         )
                         self.failures.append(failure)
                 
                 logger.info(f"  → {new_urls_count} new URLs added")
                 
-                # Reset retry counter on successful processing
-                retry_attempt = 0
-                
                 # Stop immediately if no URLs found on any page
                 if new_urls_count == 0:
                     logger.info(f"✓ No job URLs found on page {page_num}, stopping pagination")
                     break
                 
                 # Stop if we found no articles at all (empty page)
-                if len(articles) == 0:
+                if len(job_links) == 0:
                     logger.info(f"✓ Last page reached (found 0 articles on page {page_num})")
                     break
                 
@@ -663,7 +894,7 @@ class AvatureMultiStrategyScraper:
                 
                 page_num += 1
                 offset += page_size
-                time.sleep(3)  # Further increased rate limiting between pages to avoid 406
+                throttle_attempts = 0
                 
             except requests.exceptions.Timeout:
                 logger.warning(f"Timeout on page {page_num}, recording for retry")
@@ -701,28 +932,189 @@ class AvatureMultiStrategyScraper:
                 self.failures.append(failure)
                 break
         
+        # Pagination can stop before the estimated last page: drop what is still
+        # queued and wait for requests already on the wire
+        prefetch_stop.set()
+        prefetcher.shutdown(wait=True, cancel_futures=True)
+        
         logger.info(f"HTML pagination: {len(urls)} new URLs extracted\n")
         
         return urls
     
+    @staticmethod
+    def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+        """Seconds from a Retry-After header (delay or HTTP date), None if absent or unreadable"""
+        value = resp.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return Retry().parse_retry_after(value)
+        except InvalidHeader:
+            return None
+    
+    def _update_rate_delay(self, throttled: bool):
+        """
+        Adjust the inter-page delay from the latest response: doubled when throttled,
+        lowered by one step after each run of clean pages (AIMD on the request rate)
+        """
+        if throttled:
+            self._rate_delay = min(_PAGE_DELAY_MAX, self._rate_delay * 2)
+            self._consecutive_ok = 0
+            logger.debug(f"Throttled, inter-page delay raised to {self._rate_delay}s")
+            return
+        
+        self._consecutive_ok += 1
+        if self._consecutive_ok >= _PAGE_DELAY_CLEAN_RUN:
+            self._rate_delay = max(_PAGE_DELAY_MIN, self._rate_delay - _PAGE_DELAY_STEP)
+            self._consecutive_ok = 0
+    
+    def _absolute_url(self, href: str) -> str:
+        """
+        Make a job href absolute
+        Avature hrefs are either absolute or root-relative, so plain concatenation
+        covers them; urljoin is only needed for anything more unusual
+        """
+        if href[:4] == 'http':
+            return href
+        if href[:1] == '/' and href[:2] != '//':
+            return self.domain + href
+        return urljoin(self.domain, href)
+    
+    def _paced_listing_get(self, search_url: str, params: Dict[str, int], headers: Dict[str, str],
+                           stop: Optional[threading.Event] = None) -> Optional[requests.Response]:
+        """
+        GET a listing page in the next free pacing slot, _rate_delay after the previous one
+        Returns None without a request if stop is set while waiting for the slot
+        """
+        with self._page_slot_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_page_slot)
+            self._next_page_slot = slot + self._rate_delay
+        if stop is not None:
+            if stop.wait(max(0.0, slot - now)):
+                return None
+        elif slot > now:
+            time.sleep(slot - now)
+        return self.session.get(search_url, params=params, headers=headers, timeout=15)
+    
+    def _find_job_links(self, content: bytes) -> List[str]:
+        """
+        Find job detail links on a listing page, one per job container
+        Takes the raw response body - the parsers sniff the encoding themselves
+        Returns hrefs in page order (possibly relative), without duplicates
+        """
+        if self.fast_mode:
+            hrefs = [html_lib.unescape(href.decode('utf-8', 'replace')) for href in _FAST_HREF_RE.findall(content)]
+            if hrefs:
+                return list(dict.fromkeys(hrefs))
+            # No hits usually means an anti-bot page or a changed layout - parse it properly
+            logger.debug("Fast href scan found no job links, falling back to HTML parsing")
+        
+        hrefs = []
+        
+        # First layout with any containers wins; each container contributes its first job link
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(content)
+            for selector in _JOB_CONTAINER_SELECTORS:
+                containers = tree.css(selector)
+                if containers:
+                    for container in containers:
+                        link = container.css_first(_JOB_LINK_SELECTOR)
+                        if link:
+                            hrefs.append(link.attributes.get('href'))
+                    break
+        else:
+            soup = BeautifulSoup(content, 'lxml', parse_only=_JOB_STRAINER)
+            for selector in _JOB_CONTAINER_SELECTORS:
+                containers = soup.select(selector)
+                if containers:
+                    for container in containers:
+                        link = container.select_one(_JOB_LINK_SELECTOR)
+                        if link:
+                            hrefs.append(link.get('href'))
+                    break
+        
+        # Nested containers (e.g. a li inside a matching li) point at the same link
+        return list(dict.fromkeys(href for href in hrefs if href))
+    
     def _get_pagination_params(self, page_size: int, offset: int) -> Dict[str, int]:
         """
         Get correct pagination parameters based on site type
         Different Avature implementations use different parameter names
+        The parameter style is detected once per scraper and cached
         """
-        # Check page source to determine parameter style
-        try:
-            resp = self.session.get(f"{self.base_url}/SearchJobs/", timeout=10)
-            if 'pipelineRecordsPerPage' in resp.text or 'PipelineDetail' in resp.text:
-                return {'pipelineRecordsPerPage': page_size, 'pipelineOffset': offset}
-            elif 'folderRecordsPerPage' in resp.text or 'FolderDetail' in resp.text:
-                return {'folderRecordsPerPage': page_size, 'folderOffset': offset}
-            else:
+        if self._pagination_keys is None:
+            # Check page source to determine parameter style
+            try:
+                self._pagination_keys = tuple(self._probe_search_page()['pagination_keys'])
+            except Exception:
+                # Default to standard parameters (not cached, the next call may get through)
                 return {'jobRecordsPerPage': page_size, 'jobOffset': offset}
-        except:
-            # Default to standard parameters
-            return {'jobRecordsPerPage': page_size, 'jobOffset': offset}
+        
+        page_size_key, offset_key = self._pagination_keys
+        return {page_size_key: page_size, offset_key: offset}
     
+    def _probe_search_page(self) -> Dict:
+        """
+        Fetch the default search page once and read both the server's page size
+        and the pagination parameter style from it
+        The result is kept for the scraper's lifetime; failures are not cached
+        """
+        if self._probe_result is None:
+            self._probe_result = self._conditional_get(
+                f"{self.base_url}/SearchJobs/",
+                self._parse_search_probe,
+                timeout=10
+            )
+        return self._probe_result
+    
+    def _parse_search_probe(self, resp: requests.Response) -> Dict:
+        """Read page size and pagination parameter names from a search page"""
+        markers = {m.group(0) for m in _PAGINATION_STYLE_RE.finditer(resp.content)}
+        if markers & {b'pipelineRecordsPerPage', b'PipelineDetail'}:
+            pagination_keys = ('pipelineRecordsPerPage', 'pipelineOffset')
+        elif markers & {b'folderRecordsPerPage', b'FolderDetail'}:
+            pagination_keys = ('folderRecordsPerPage', 'folderOffset')
+        else:
+            pagination_keys = ('jobRecordsPerPage', 'jobOffset')
+        
+        return {
+            # Use the same logic as the actual scraping to find job containers
+            'page_size': len(self._find_job_links(resp.content)),
+            'pagination_keys': pagination_keys
+        }
+    
+    @classmethod
+    def _get_shared_browser(cls):
+        """
+        Return the calling thread's headless Chromium, launching it on first use
+        The thread that launched it closes it with _close_shared_browser
+        """
+        local = cls._browser_local
+        if getattr(local, 'browser', None) is None:
+            local.playwright = sync_playwright().start()
+            local.browser = local.playwright.chromium.launch(headless=True)
+            # atexit handlers run on the main thread, so only its browser can be left to them
+            if threading.current_thread() is threading.main_thread() and not getattr(local, 'close_at_exit', False):
+                atexit.register(cls._close_shared_browser)
+                local.close_at_exit = True
+        return local.browser
+
+    @classmethod
+    def _close_shared_browser(cls):
+        """Shut down the calling thread's browser and Playwright driver, if it started one"""
+        local = cls._browser_local
+        try:
+            if getattr(local, 'browser', None) is not None:
+                local.browser.close()
+            if getattr(local, 'playwright', None) is not None:
+                local.playwright.stop()
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {e}")
+        finally:
+            local.browser = None
+            local.playwright = None
+
     def _get_aws_waf_token(self):
         """Get AWS WAF token by solving the JavaScript challenge using Playwright"""
         try:
@@ -733,66 +1125,68 @@ class AvatureMultiStrategyScraper:
                 
             logger.info("Solving AWS WAF JavaScript challenge...")
             
-            with sync_playwright() as p:
-                # Launch browser in headless mode
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                page = context.new_page()
-                
-                # Use the current site's URL (not hardcoded Koch URL)
-                target_url = self.base_url
-                logger.info(f"Loading {target_url} to solve AWS WAF challenge...")
-                
-                # Set a reasonable timeout for the challenge
-                page.set_default_timeout(30000)  # 30 seconds
+            # Reuse this thread's warm browser; contexts are cheap to create
+            browser = AvatureMultiStrategyScraper._get_shared_browser()
+            context = browser.new_context(
+                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            )
+            page = context.new_page()
+            
+            # Use the current site's URL (not hardcoded Koch URL)
+            target_url = self.base_url
+            logger.info(f"Loading {target_url} to solve AWS WAF challenge...")
+            
+            # Set a reasonable timeout for the challenge
+            page.set_default_timeout(30000)  # 30 seconds
+            
+            try:
+                # Navigate and wait for the page to load completely
+                response = page.goto(target_url, wait_until='networkidle')
                 
-                try:
-                    # Navigate and wait for the page to load completely
-                    response = page.goto(target_url, wait_until='networkidle')
-                    
-                    # Check if we got a challenge response
-                    if response and response.status in [202, 403]:
-                        logger.info("AWS WAF challenge detected, waiting for resolution...")
-                        # Wait for the challenge to be solved (usually takes a few seconds)
-                        page.wait_for_load_state('networkidle')
-                        
-                        # Wait a bit more to ensure JS challenge is fully resolved
-                        time.sleep(5)  # Increased wait time for more complex challenges
+                # Check if we got a challenge response
+                if response and response.status in [202, 403]:
+                    logger.info("AWS WAF challenge detected, waiting for resolution...")
+                    # Wait for the challenge to be solved (usually takes a few seconds)
+                    page.wait_for_load_state('networkidle')
                     
-                    # Extract cookies after challenge is solved
-                    cookies = context.cookies()
-                    
-                    # Find the aws-waf-token
-                    waf_token = None
-                    for cookie in cookies:
-                        if cookie['name'] == 'aws-waf-token':
-                            waf_token = cookie['value']
+                    # Poll for the token cookie rather than sleeping a fixed 5s;
+                    # complex challenges still get up to 5s to resolve
+                    for _ in range(25):
+                        if any(c['name'] == 'aws-waf-token' for c in context.cookies()):
                             break
-                    
-                    if waf_token:
-                        logger.info("✓ AWS WAF token obtained successfully")
-                        # Set the token in our session
-                        self.session.cookies.set('aws-waf-token', waf_token)
-                    else:
-                        logger.warning("Could not find aws-waf-token in cookies")
-                    
-                    # Set all other cookies that were obtained
-                    for cookie in cookies:
-                        self.session.cookies.set(
-                            cookie['name'], 
-                            cookie['value'],
-                            domain=cookie.get('domain'),
-                            path=cookie.get('path', '/')
-                        )
-                    
-                    logger.info(f"✓ Set {len(cookies)} cookies from browser session")
-                    
-                except Exception as e:
-                    logger.error(f"Error during AWS WAF challenge resolution: {e}")
-                finally:
-                    browser.close()
+                        page.wait_for_timeout(200)
+                
+                # Extract cookies after challenge is solved
+                cookies = context.cookies()
+                
+                # Find the aws-waf-token
+                waf_token = next((c['value'] for c in cookies if c['name'] == 'aws-waf-token'), None)
+                
+                if waf_token:
+                    logger.info("✓ AWS WAF token obtained successfully")
+                    # Set the token in our session
+                    self.session.cookies.set('aws-waf-token', waf_token)
+                else:
+                    logger.warning("Could not find aws-waf-token in cookies")
+                
+                # Set all other cookies that were obtained, merged into the session in one go
+                jar = requests.cookies.RequestsCookieJar()
+                for cookie in cookies:
+                    jar.set(
+                        cookie['name'], 
+                        cookie['value'],
+                        domain=cookie.get('domain'),
+                        path=cookie.get('path', '/')
+                    )
+                self.session.cookies.update(jar)
+                
+                logger.info(f"✓ Set {len(cookies)} cookies from browser session")
+                
+            except Exception as e:
+                logger.error(f"Error during AWS WAF challenge resolution: {e}")
+            finally:
+                # Only the context is discarded; the browser stays up for re-solves
+                context.close()
                     
             # Update headers to match browser behavior
             self.session.headers.update({
@@ -837,16 +1231,14 @@ class AvatureMultiStrategyScraper:
         """Get total job count from HTML page"""
         try:
             # Check if site needs AWS WAF authentication
-            aws_waf_protected_domains = ['koch', 'sandboxlululemoninc']
-            
-            if 'koch' in self.base_url.lower():
+            if self._is_koch:
                 self._get_aws_waf_token()
                 # Use the en_US URL format that works
                 search_url = f"https://koch.avature.net/en_US/careers/SearchJobs/?listFilterMode=1&jobRecordsPerPage=6&"
                 referer = "https://koch.avature.net/en_US/careers"
             else:
                 # For other sites with AWS WAF protection, try to get auth token first
-                if any(domain in self.base_url.lower() for domain in aws_waf_protected_domains):
+                if self._needs_waf:
                     self._get_aws_waf_token()
                 
                 # Use standard URL format for non-Koch sites
@@ -866,76 +1258,147 @@ class AvatureMultiStrategyScraper:
                 'Sec-Fetch-Site': 'same-origin',
             }
             
-            resp = self.session.get(search_url, headers=headers, timeout=10)
-            
-            # Accept both 200 and 202 status codes
-            if resp.status_code not in [200, 202]:
-                logger.warning(f"HTTP {resp.status_code} when getting job count")
-                return None
-                
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Try multiple selectors for job count
-            selectors = [
-                'div.list-controls__legend',  # Updated selector
-                'div.list-controls__text__legend',  # Fallback
-                '.list-controls__legend',
-                '.search__panel__count--span',  # New selector for amswh format
-                '.pagination__legend',  # New selector for ashfieldhealthcare format
-                '.legend',
-                '.section__title--3'  # Koch-specific selector for "999+" jobs
-            ]
-            
-            for selector in selectors:
-                legend = soup.select_one(selector)
-                if legend:
-                    text = legend.get_text(strip=True)
-                    logger.debug(f"Found legend text: '{text}'")
-                    
-                    # Try different regex patterns for job count
-                    patterns = [
-                        r'Showing\s+\d+-\d+\s+of\s+(\d+)\+?',  # "Showing 1-10 of 106 results" or "999+ results"
-                        r'There\s+are\s+(\d+)\+?\s+jobs\s+matching',  # "There are 80 jobs matching" or "999+ jobs matching"
-                        r'of\s+(\d+)\+?\s+results',  # "of 106 results" or "999+ results"  
-                        r'of\s+(\d+)\+?',  # "of 106" or "999+"
-                        r'(\d+)\+?\s+results',  # "106 results" or "999+ results"
-                        r'(\d+)\+?\s+jobs',  # "80 jobs" or "999+ jobs"
-                        r'^(\d+)\+$',  # Direct "999+" pattern (whole text)
-                        r'(\d+)\+',  # Direct "999+" pattern (anywhere)
-                        r'(\d+)\s*available\s*positions?',  # "999 available positions"
-                        r'(\d+)\s*open\s*positions?',  # "999 open positions"
-                    ]
-                    
-                    for pattern in patterns:
-                        match = re.search(pattern, text, re.IGNORECASE)
-                        if match:
-                            count = int(match.group(1))
-                            logger.debug(f"Extracted job count: {count}")
-                            return count
-                    break
+            return self._conditional_get(search_url, self._parse_total_job_count, headers=headers, timeout=10)
                     
         except Exception as e:
             logger.warning(f"Could not determine total job count: {e}")
         
         return None
     
+    def _parse_total_job_count(self, resp: requests.Response) -> Optional[int]:
+        """Read the total job count from a search page response"""
+        # Accept both 200 and 202 status codes
+        if resp.status_code not in [200, 202]:
+            logger.warning(f"HTTP {resp.status_code} when getting job count")
+            return None
+        
+        # Fast path: find the legend in the raw HTML, checking the selectors in the
+        # same order as the parse below. Anything the byte scan can't settle
+        # (nested markup, other quoting) is left to the parse
+        content = resp.content
+        for css_class, legend_re in _JOB_COUNT_LEGEND_RES:
+            if css_class not in content:
+                continue
+            match = legend_re.search(content)
+            if match and match.group(2):
+                text = html_lib.unescape(match.group(1).decode('utf-8', 'replace')).strip()
+                logger.debug(f"Found raw legend text: '{text}'")
+                return self._job_count_from_text(text)
+            break
+        
+        soup = BeautifulSoup(content, 'lxml', from_encoding=self._declared_encoding(resp))
+        
+        # Try multiple selectors for job count
+        for selector in _JOB_COUNT_SELECTORS:
+            legend = soup.select_one(selector)
+            if legend:
+                text = legend.get_text(strip=True)
+                logger.debug(f"Found legend text: '{text}'")
+                return self._job_count_from_text(text)
+        
+        return None
+    
+    @staticmethod
+    def _job_count_from_text(text: str) -> Optional[int]:
+        """Job count from legend text, trying _JOB_COUNT_PATTERNS in order"""
+        for pattern in _JOB_COUNT_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                count = int(match.group(1))
+                logger.debug(f"Extracted job count: {count}")
+                return count
+        return None
+    
+    def _conditional_get(self, url: str, parse, **kwargs):
+        """
+        GET a search page and return parse(resp), revalidated against the on-disk cache
+        On a 304 the previously parsed value is returned without parsing again.
+        parse must be a named function or method, since its name is part of the key
+        """
+        cache = AvatureMultiStrategyScraper._load_search_cache()
+        # Keyed by parser too, so a page read two ways keeps both values
+        cache_key = f"{parse.__name__} {url}"
+        entry = cache.get(cache_key)
+        
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        resp = self.session.get(url, headers=headers, **kwargs)
+        
+        if resp.status_code == 304 and entry:
+            logger.debug(f"Search page not modified, reusing cached value: {url}")
+            return entry['value']
+        
+        value = parse(resp)
+        
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        if value is not None and (etag or last_modified):
+            AvatureMultiStrategyScraper._store_search_cache_entry(
+                cache_key, {'etag': etag, 'last_modified': last_modified, 'value': value}
+            )
+        
+        return value
+    
+    @classmethod
+    def _load_search_cache(cls) -> Dict:
+        """Load the conditional-GET cache from disk once per process"""
+        with cls._search_cache_lock:
+            if cls._search_cache is None:
+                try:
+                    with open(_SEARCH_CACHE_FILE, 'r', encoding='utf-8') as f:
+                        cls._search_cache = json.load(f)
+                except (OSError, ValueError):
+                    cls._search_cache = {}
+            return cls._search_cache
+    
+    @classmethod
+    def _store_search_cache_entry(cls, cache_key: str, entry: Dict):
+        """
+        Add an entry to the conditional-GET cache and write the cache back to disk
+        Both happen under the lock so parallel companies never dump a dict that is
+        being changed; the file is replaced atomically. Failures only cost a refetch
+        """
+        with cls._search_cache_lock:
+            cls._search_cache[cache_key] = entry
+            try:
+                data = json.dumps(cls._search_cache)
+                _SEARCH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=_SEARCH_CACHE_FILE.parent,
+                                                 suffix='.tmp', delete=False) as f:
+                    f.write(data)
+                os.replace(f.name, _SEARCH_CACHE_FILE)
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug(f"Could not save search page cache: {e}")
+    
     def _get_job_urls_from_sitemap(self, sitemap_url: str) -> List[str]:
         """Parse sitemap and extract job URLs"""
         try:
             logger.info(f"Fetching sitemap: {sitemap_url}")
-            resp = self.session.get(sitemap_url, timeout=15)
-            
-            if resp.status_code != 200:
-                return []
-            
-            soup = BeautifulSoup(resp.content, 'xml')
-            locs = soup.find_all('loc')
-            
-            job_urls = []
-            for loc in locs:
-                url = loc.text.strip()
-                if '/JobDetail/' in url:
-                    job_urls.append(url)
+            with self.session.get(sitemap_url, timeout=15, stream=True) as resp:
+                if resp.status_code != 200:
+                    return []
+                
+                # Parse straight off the socket; let urllib3 undo any gzip encoding
+                resp.raw.decode_content = True
+                
+                # Stream <loc> entries instead of building the whole sitemap tree
+                job_urls = []
+                # huge_tree lifts libxml2's size limits for very large sitemaps
+                for _, elem in etree.iterparse(resp.raw, tag='{*}loc', huge_tree=True):
+                    url = (elem.text or '').strip()
+                    if '/JobDetail/' in url:
+                        job_urls.append(url)
+                    elem.clear()
+                    # Drop the <url> entries already handled so memory stays flat
+                    entry = elem.getparent()
+                    if entry is not None:
+                        while entry.getprevious() is not None:
+                            del entry.getparent()[0]
             
             return job_urls
         
@@ -946,65 +1409,34 @@ class AvatureMultiStrategyScraper:
     def _detect_page_size(self) -> int:
         """Detect the page size returned by the server by actually counting job containers"""
         try:
-            resp = self.session.get(f"{self.base_url}/SearchJobs/", timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Use the same logic as the actual scraping to find job containers
-            # Try multiple job container structures in order
-            articles = soup.find_all('article', class_='article--result')
-            
-            # If no standard articles found, try alternative structures
-            if not articles:
-                # First try to find li elements that actually contain job links
-                all_lis = soup.find_all('li')
-                list_items = [li for li in all_lis if li.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                
-                if list_items:
-                    articles = list_items
-                else:
-                    # Try table rows with specific class first (DeloitteBE style)
-                    table_rows = soup.find_all('tr', class_='card--box')
-                    if table_rows:
-                        articles = table_rows
-                    else:
-                        # Try any table rows that contain job links (sandboxbnc style)
-                        all_trs = soup.find_all('tr')
-                        table_job_rows = [tr for tr in all_trs if tr.find('a', href=re.compile(r'/(JobDetail|FolderDetail|PipelineDetail)/'))]
-                        if table_job_rows:
-                            articles = table_job_rows
-                        else:
-                            # Other possible alternative structures
-                            div_jobs = soup.find_all('div', class_=lambda x: x and 'job' in x.lower())
-                            if div_jobs:
-                                articles = div_jobs
-            
-            detected = len(articles) if articles else 10  # Default to 10 instead of 12
+            detected = self._probe_search_page()['page_size'] or 10  # Default to 10 instead of 12
             logger.debug(f"Auto-detected page size: {detected}")
             return detected
         except Exception as e:
             logger.debug(f"Error detecting page size: {e}")
             return 10  # Default fallback changed to 10
     
-    def _deduplicate_urls(self, urls: List[str]) -> List[str]:
-        """Deduplicate URLs based on job ID, keeping the first occurrence"""
-        seen_job_ids = set()
+    def _deduplicate_urls(self, *url_lists: List[str]) -> List[str]:
+        """
+        Deduplicate URLs based on job ID, keeping the first occurrence
+        Accepts several lists so callers don't have to concatenate them first
+        """
+        seen = set()
         deduplicated = []
-        
-        for url in urls:
-            try:
-                job_id = self._extract_job_id(url)
-                if job_id not in seen_job_ids:
-                    seen_job_ids.add(job_id)
+        total_urls = 0
+        
+        for urls in url_lists:
+            total_urls += len(urls)
+            for url in urls:
+                # Numeric IDs are keyed as ints; anything else by its last path segment
+                match = _JOB_ID_RE.search(url)
+                key = int(match.group(1)) if match else self._extract_job_id(url)
+                if key not in seen:
+                    seen.add(key)
                     deduplicated.append(url)
-                else:
-                    logger.debug(f"Skipping duplicate job ID {job_id}: {url}")
-            except Exception as e:
-                # If we can't extract job ID, keep the URL to be safe
-                logger.debug(f"Could not extract job ID from {url}: {e}")
-                deduplicated.append(url)
         
-        if len(urls) != len(deduplicated):
-            logger.info(f"Removed {len(urls) - len(deduplicated)} duplicate URLs")
+        if total_urls != len(deduplicated):
+            logger.info(f"Removed {total_urls - len(deduplicated)} duplicate URLs")
         
         return deduplicated
     
@@ -1058,7 +1490,10 @@ class AvatureMultiStrategyScraper:
         job_id = self._extract_job_id(job_url)
         
         try:
-            resp = self.session.get(job_url, timeout=timeout)
+            # Streamed so closed jobs and error pages are never downloaded in full
+            resp = self.session.get(job_url, timeout=timeout, stream=True)
+            if resp.status_code != 200:
+                resp.close()
             
             # Handle HTTP errors
             if resp.status_code == 404:
@@ -1105,64 +1540,44 @@ class AvatureMultiStrategyScraper:
                     http_status=resp.status_code
                 )
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Check for "position filled" or "closed" messages
-            page_text = resp.text.lower()
-            
-            if "position has been filled" in page_text:
-                logger.debug(f"Position filled: {job_url}")
-                return JobFailure(
-                    url=job_url,
-                    job_id=job_id,
-                    company=self.company_name,
-                    error_type='position_filled',
-                    error_message='Job page indicates position has been filled',
-                    http_status=200
-                )
-            
-            if "no longer accepting applications" in page_text:
-                logger.debug(f"Applications closed: {job_url}")
-                return JobFailure(
-                    url=job_url,
-                    job_id=job_id,
-                    company=self.company_name,
-                    error_type='applications_closed',
-                    error_message='Job page indicates applications are no longer accepted',
-                    http_status=200
-                )
-            
-            if "this job posting has expired" in page_text:
-                logger.debug(f"Job expired: {job_url}")
+            # Check for "position filled" or "closed" messages on the raw bytes,
+            # before paying for a parse. The banner sits near the top of the page,
+            # so look at a prefix first and only download the rest if it's not there
+            resp.raw.decode_content = True
+            body = resp.raw.read(_DETAIL_PREFIX_BYTES)
+            closed_match = _CLOSED_JOB_RE.search(body)
+            if closed_match:
+                resp.close()
+            else:
+                prefix_len = len(body)
+                body += resp.raw.read()
+                # Overlap the boundary so a phrase split across the two reads still matches
+                closed_match = _CLOSED_JOB_RE.search(body, max(0, prefix_len - 64))
+            if closed_match:
+                error_type, error_message, log_label = _CLOSED_JOB_REASONS[closed_match.group(0).lower()]
+                logger.debug(f"{log_label}: {job_url}")
                 return JobFailure(
                     url=job_url,
                     job_id=job_id,
                     company=self.company_name,
-                    error_type='job_expired',
-                    error_message='Job posting has expired',
+                    error_type=error_type,
+                    error_message=error_message,
                     http_status=200
                 )
             
-            # Extract title
-            title = None
-            # First try Avature-specific job title selectors
-            title_selectors = [
-                'h2.banner__text__title',  # UCLA Health pattern
-                'div.article__content__view__field__value--font .article__content__view__field__value',  # Bloomberg pattern
-                'h1.title',  # Fallback
-                'h1', 
-                'h2'
-            ]
+            # Parse only the content elements first (skipping head, scripts, styles);
+            # fall back to a full parse when something wasn't found in the strained tree
+            encoding = self._declared_encoding(resp)
+            # selectolax, when installed, serves the read-only metadata and apply-link
+            # lookups from its own full (and much cheaper) parse
+            tree = LexborHTMLParser(body) if SELECTOLAX_AVAILABLE else None
+            soup = BeautifulSoup(body, 'lxml', from_encoding=encoding, parse_only=_JOB_PAGE_STRAINER)
+            job = self._parse_job_page(soup, job_url, job_id, source_method, full_page=False, tree=tree)
+            if job is None or not job.location or (job.application_url is None and tree is None):
+                soup = BeautifulSoup(body, 'lxml', from_encoding=encoding)
+                job = self._parse_job_page(soup, job_url, job_id, source_method, full_page=True, tree=tree)
             
-            for selector in title_selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    title = elem.get_text(strip=True)
-                    # Validate it's actually a job title, not page title
-                    if title and len(title) > 5 and not title.lower().endswith(' home page'):
-                        break
-            
-            if not title:
+            if job is None:
                 logger.warning(f"No title found for {job_url}")
                 return JobFailure(
                     url=job_url,
@@ -1173,79 +1588,11 @@ class AvatureMultiStrategyScraper:
                     http_status=200
                 )
             
-            # Extract location
-            location = ''
-            
-            # First try to find location in structured fields
-            location_fields = soup.find_all('div', class_='article__content__view__field')
-            for field in location_fields:
-                label_elem = field.find('div', class_='article__content__view__field__label')
-                value_elem = field.find('div', class_='article__content__view__field__value')
-                
-                if label_elem and value_elem:
-                    label = label_elem.get_text(strip=True)
-                    if 'Location' in label:
-                        location = value_elem.get_text(strip=True)
-                        break
-            
-            # Fallback to original selectors
-            if not location:
-                location_selectors = [
-                    'span.list-item-location',
-                    'span.location', 
-                    'div.location',
-                    'p.location',
-                ]
-                
-                for selector in location_selectors:
-                    elem = soup.select_one(selector)
-                    if elem:
-                        location = elem.get_text(strip=True)
-                        break
-            
-            # Look for "Work Location: X" pattern in text
-            if not location:
-                page_text = soup.get_text()
-                work_location_match = re.search(r'Work Location[:\s]*([^\n]+)', page_text, re.IGNORECASE)
-                if work_location_match:
-                    location = work_location_match.group(1).strip()
-            
-            # Generic location pattern matching as final fallback
-            if not location:
-                article_header = soup.select_one('div.article__header')
-                if article_header:
-                    text = article_header.get_text()
-                    loc_match = re.search(r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2,})', text)
-                    if loc_match:
-                        location = loc_match.group(1).strip()
-            
-            # Extract description
-            description = self._extract_description(soup)
-            
-            # Extract all metadata
-            metadata = self._extract_metadata(soup)
-            date_posted = metadata.get('date_posted')
-            department = metadata.get('department') 
-            employment_type = metadata.get('employment_type')
-            
-            # Extract application URL
-            application_url = self._extract_application_url(soup, job_url)
-            
-            return Job(
-                job_id=job_id,
-                title=title,
-                url=job_url,
-                location=location,
-                company=self.company_name,
-                source_method=source_method,
-                description=description,
-                date_posted=date_posted,
-                department=department,
-                employment_type=employment_type,
-                application_url=application_url
-            )
+            return job
         
-        except requests.exceptions.Timeout:
+        # The body is read from resp.raw, whose errors are urllib3's own rather
+        # than the requests exceptions they would be wrapped in by resp.content
+        except (requests.exceptions.Timeout, ReadTimeoutError):
             logger.debug(f"Timeout after {timeout}s: {job_url}")
             return JobFailure(
                 url=job_url,
@@ -1255,7 +1602,7 @@ class AvatureMultiStrategyScraper:
                 error_message=f'Request timed out after {timeout} seconds'
             )
         
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, ProtocolError):
             logger.debug(f"Connection error: {job_url}")
             return JobFailure(
                 url=job_url,
@@ -1275,8 +1622,169 @@ class AvatureMultiStrategyScraper:
                 error_message=f'Unexpected error: {str(e)}'
             )
     
-    def _extract_description(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract clean job description"""
+    def _parse_job_page(self, soup: BeautifulSoup, job_url: str, job_id: str, source_method: str,
+                        full_page: bool = True, tree=None) -> Optional[Job]:
+        """
+        Extract a Job from a parsed job detail page; None when no title is found
+        With full_page=False (a strained tree) the location fallbacks that read
+        the whole page text are skipped and a Job without location is returned.
+        tree is an optional selectolax parse of the same page for the metadata
+        and application URL lookups
+        """
+        # Extract title
+        title = None
+        # First try Avature-specific job title selectors
+        title_selectors = [
+            'h2.banner__text__title',  # UCLA Health pattern
+            'div.article__content__view__field__value--font .article__content__view__field__value',  # Bloomberg pattern
+            'h1.title',  # Fallback
+            'h1', 
+            'h2'
+        ]
+        
+        for selector in title_selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                title = elem.get_text(strip=True)
+                # Validate it's actually a job title, not page title
+                if title and len(title) > 5 and not title.lower().endswith(' home page'):
+                    break
+        
+        if not title:
+            return None
+        
+        # One pass over the structured fields feeds location, metadata and description
+        fields = self._extract_structured_fields(soup)
+        
+        # Extract location
+        location = fields['location'] or ''
+        
+        # Fallback to original selectors
+        if not location:
+            location_selectors = [
+                'span.list-item-location',
+                'span.location', 
+                'div.location',
+                'p.location',
+            ]
+            
+            for selector in location_selectors:
+                elem = soup.select_one(selector)
+                if elem:
+                    location = elem.get_text(strip=True)
+                    break
+        
+        # The page-text fallbacks need the whole document, not the strained tree;
+        # hand back a location-less Job so the caller reparses in full
+        if not location and not full_page:
+            return Job(
+                job_id=job_id,
+                title=title,
+                url=job_url,
+                location='',
+                company=self.company_name,
+                source_method=source_method
+            )
+        
+        # Look for "Work Location: X" pattern in text
+        if not location:
+            page_text = soup.get_text()
+            work_location_match = _WORK_LOCATION_RE.search(page_text)
+            if work_location_match:
+                location = work_location_match.group(1).strip()
+        
+        # Generic location pattern matching as final fallback
+        if not location:
+            article_header = soup.select_one('div.article__header')
+            if article_header:
+                text = article_header.get_text()
+                loc_match = _LOCATION_RE.search(text)
+                if loc_match:
+                    location = loc_match.group(1).strip()
+        
+        # Extract description
+        description = self._extract_description(soup, rich_text=fields['rich_text'])
+        
+        # Extract all metadata
+        metadata = self._extract_metadata(soup, fields, tree=tree)
+        date_posted = metadata.get('date_posted')
+        department = metadata.get('department') 
+        employment_type = metadata.get('employment_type')
+        
+        # Extract application URL
+        application_url = self._extract_application_url(soup, job_url, tree=tree)
+        
+        return Job(
+            job_id=job_id,
+            title=title,
+            url=job_url,
+            location=location,
+            company=self.company_name,
+            source_method=source_method,
+            description=description,
+            date_posted=date_posted,
+            department=department,
+            employment_type=employment_type,
+            application_url=application_url
+        )
+    
+    def _extract_structured_fields(self, soup: BeautifulSoup) -> Dict:
+        """
+        Walk the Avature label/value field sections once and collect everything
+        the detail extractors need from them: location, the metadata fields and
+        the first rich-text field (the usual description container)
+        """
+        fields = {
+            'location': None,
+            'date_posted': None,
+            'department': None,
+            'employment_type': None,
+            'rich_text': None
+        }
+        
+        for field in soup.find_all('div', class_='article__content__view__field'):
+            if fields['rich_text'] is None and 'field--rich-text' in field.get('class', []):
+                fields['rich_text'] = field
+            
+            label_elem = field.find('div', class_='article__content__view__field__label')
+            value_elem = field.find('div', class_='article__content__view__field__value')
+            
+            if label_elem and value_elem:
+                keys = self._field_keys_for_label(label_elem.get_text(strip=True))
+                if not keys:
+                    continue
+                value = value_elem.get_text(strip=True)
+                
+                # Location keeps the first match, the metadata fields the last
+                for key in keys:
+                    if key != 'location' or fields['location'] is None:
+                        fields[key] = value
+        
+        return fields
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _field_keys_for_label(label: str) -> Tuple[str, ...]:
+        """
+        Map a structured field label to the field keys it fills
+        Exact labels resolve through _LABEL_MAP; anything else falls back to the
+        substring rules once, after which the answer is memoized per label
+        """
+        key = _LABEL_MAP.get(label.strip().rstrip(':').strip().lower())
+        if key:
+            return (key,)
+        
+        keys = ['location'] if 'Location' in label else []
+        metadata_key = next((k for sub, k in _LABEL_SUBSTRINGS if sub in label), None)
+        if metadata_key:
+            keys.append(metadata_key)
+        return tuple(keys)
+    
+    def _extract_description(self, soup: BeautifulSoup, rich_text=None) -> Optional[str]:
+        """
+        Extract clean job description
+        rich_text is the primary description field when the caller already found it
+        """
         # Find the main description content
         desc_selectors = [
             'div.article__content__view__field.field--rich-text',  # Primary description field
@@ -1287,66 +1795,79 @@ class AvatureMultiStrategyScraper:
         ]
         
         for selector in desc_selectors:
-            elem = soup.select_one(selector)
+            if rich_text is not None and selector == desc_selectors[0]:
+                elem = rich_text
+            else:
+                elem = soup.select_one(selector)
             if elem:
-                # Create a copy to avoid modifying original
-                elem_copy = BeautifulSoup(str(elem), 'html.parser')
-                
-                # Remove navigation elements and buttons
-                for nav in elem_copy.find_all(['nav', 'header', 'footer']):
-                    nav.decompose()
-                
-                # Remove "Apply Now", "Back to" and similar buttons/links
-                for button in elem_copy.find_all(['a', 'button'], string=re.compile(r'Apply\s*Now|Back\s*to|Log\s*In|Save\s*this\s*Job', re.IGNORECASE)):
-                    button.decompose()
+                # Removing elements can only shorten the text, so a candidate that is
+                # already too short can be skipped without any cleanup
+                text = elem.get_text(separator='\n', strip=True)
+                if len(text) <= 50:
+                    continue
                 
-                # Remove any remaining buttons
-                for button in elem_copy.find_all(['a', 'button'], class_=re.compile(r'button')):
-                    button.decompose()
+                # Only copy the subtree when there is navigation or buttons to strip;
+                # copy.copy duplicates the tree without a serialize/reparse round-trip
+                if elem.find(['nav', 'header', 'footer', 'a', 'button']) is not None:
+                    elem_copy = copy.copy(elem)
+                    
+                    # Remove navigation elements and buttons
+                    for nav in elem_copy.find_all(['nav', 'header', 'footer']):
+                        nav.decompose()
+                    
+                    # Remove "Apply Now", "Back to" and similar buttons/links
+                    for button in elem_copy.find_all(['a', 'button'], string=_NAV_BUTTON_TEXT_RE):
+                        button.decompose()
+                    
+                    # Remove any remaining buttons
+                    for button in elem_copy.find_all(['a', 'button'], class_=_BUTTON_CLASS_RE):
+                        button.decompose()
+                    
+                    text = elem_copy.get_text(separator='\n', strip=True)
                 
-                text = elem_copy.get_text(separator='\n', strip=True)
-                text = re.sub(r'\n{3,}', '\n\n', text)
+                text = _BLANK_LINES_RE.sub('\n\n', text)
                 
                 if text and len(text) > 50:  # Ensure we have substantial content
                     return text
         
         return None
     
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
-        """Extract all metadata fields from job posting"""
+    def _extract_metadata(self, soup: BeautifulSoup, fields: Optional[Dict] = None, tree=None) -> Dict[str, Optional[str]]:
+        """
+        Extract all metadata fields from job posting
+        With a selectolax tree the selector fallbacks run on it instead of the soup
+        """
+        # Extract from structured field sections (Avature pattern)
+        if fields is None:
+            fields = self._extract_structured_fields(soup)
         metadata = {
-            'date_posted': None,
-            'department': None, 
-            'employment_type': None
+            'date_posted': fields['date_posted'],
+            'department': fields['department'],
+            'employment_type': fields['employment_type']
         }
         
-        # Extract from structured field sections (Avature pattern)
-        fields = soup.find_all('div', class_='article__content__view__field')
-        for field in fields:
-            label_elem = field.find('div', class_='article__content__view__field__label')
-            value_elem = field.find('div', class_='article__content__view__field__value')
+        if tree is not None:
+            if not metadata['date_posted']:
+                for selector in _DATE_SELECTORS:
+                    node = tree.css_first(selector)
+                    if node is not None:
+                        date_str = node.attributes.get('datetime') or node.text(strip=True)
+                        if date_str:
+                            metadata['date_posted'] = date_str
+                            break
             
-            if label_elem and value_elem:
-                label = label_elem.get_text(strip=True)
-                value = value_elem.get_text(strip=True)
-                
-                # Map specific fields
-                if 'Posted Date' in label or 'Date Posted' in label:
-                    metadata['date_posted'] = value
-                elif 'Employment Type' in label or 'Job Type' in label:
-                    metadata['employment_type'] = value
-                elif 'Business Area' in label or 'Department' in label or 'Division' in label:
-                    metadata['department'] = value
+            if not metadata['department']:
+                for selector in _DEPARTMENT_SELECTORS:
+                    node = tree.css_first(selector)
+                    if node is not None:
+                        metadata['department'] = node.text(strip=True)
+                        break
+            
+            return metadata
         
         # Fallback to original selectors if structured fields didn't work
         if not metadata['date_posted']:
-            date_selectors = [
-                'span.date-posted',
-                'time',
-                'span[class*="date"]',
-            ]
-            
-            for selector in date_selectors:
+            for selector in _DATE_SELECTORS:
                 elem = soup.select_one(selector)
                 if elem:
                     date_str = elem.get('datetime') or elem.get_text(strip=True)
@@ -1355,104 +1876,150 @@ class AvatureMultiStrategyScraper:
                         break
         
         if not metadata['department']:
-            dept_selectors = [
-                'span.department',
-                'span.category',
-                'div[class*="department"]',
-            ]
+            # One walk over span/div candidates instead of a CSS query per selector,
+            # keeping the old priority: span.department, span.category, div[class*="department"]
+            dept_matches = [None, None, None]
+            for elem in soup.find_all(['span', 'div'], class_=_DEPARTMENT_CLASS_RE):
+                classes = elem.get('class', [])
+                if elem.name == 'span':
+                    if dept_matches[0] is None and 'department' in classes:
+                        dept_matches[0] = elem
+                    if dept_matches[1] is None and 'category' in classes:
+                        dept_matches[1] = elem
+                elif dept_matches[2] is None and 'department' in ' '.join(classes):
+                    dept_matches[2] = elem
             
-            for selector in dept_selectors:
-                elem = soup.select_one(selector)
-                if elem:
-                    metadata['department'] = elem.get_text(strip=True)
-                    break
+            elem = next((match for match in dept_matches if match is not None), None)
+            if elem:
+                metadata['department'] = elem.get_text(strip=True)
         
         return metadata
     
-    def _extract_application_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
-        """Extract direct application URL"""
-        from urllib.parse import urljoin
-        
-        apply_selectors = [
-            'a.button.button--primary',  # Primary apply button
-            'a[href*="Login?jobId"]',  # Avature login-based application
-            'a[href*="Apply"]',
-            'a[data-map="apply-button"]',
-            'a.apply-button'
-        ]
+    def _extract_application_url(self, soup: BeautifulSoup, base_url: str, tree=None) -> Optional[str]:
+        """
+        Extract direct application URL
+        With a selectolax tree the candidate links are looked up there by CSS
+        """
+        if tree is not None:
+            for selector in _APPLY_SELECTORS:
+                node = tree.css_first(selector)
+                href = node.attributes.get('href') if node is not None else None
+                if href and any(keyword in href.lower() for keyword in _APPLY_KEYWORDS):
+                    return self._absolute_apply_url(href, base_url)
+            return None
+        
+        # First anchor for each of these patterns, in priority order, found in one walk:
+        # a.button.button--primary (primary apply button), a[href*="Login?jobId"]
+        # (Avature login-based application), a[href*="Apply"], a[data-map="apply-button"],
+        # a.apply-button
+        candidates = [None] * 5
+        for a in soup.find_all('a'):
+            classes = a.get('class', [])
+            href = a.get('href') or ''
+            checks = (
+                'button' in classes and 'button--primary' in classes,
+                'Login?jobId' in href,
+                'Apply' in href,
+                a.get('data-map') == 'apply-button',
+                'apply-button' in classes,
+            )
+            for i, matched in enumerate(checks):
+                if matched and candidates[i] is None:
+                    candidates[i] = a
+            if all(candidate is not None for candidate in candidates):
+                break
         
-        for selector in apply_selectors:
-            elem = soup.select_one(selector)
+        for elem in candidates:
             if elem and elem.get('href'):
                 href = elem.get('href')
                 # Check if this looks like an application link
-                if any(keyword in href.lower() for keyword in ['apply', 'login?jobid', 'application']):
-                    if href.startswith('http'):
-                        return href
-                    else:
-                        # Convert relative URL to absolute
-                        parsed_base = urlparse(base_url)
-                        domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
-                        return urljoin(domain, href)
+                if any(keyword in href.lower() for keyword in _APPLY_KEYWORDS):
+                    return self._absolute_apply_url(href, base_url)
         
         return None
     
-    def _extract_job_id(self, url: str) -> str:
-        """Extract job ID from URL, handling query parameters correctly"""
-        # Remove query parameters first
-        base_url = url.split('?')[0]
-        parts = base_url.rstrip('/').split('/')
-        return parts[-1] if parts else url
+    def _absolute_apply_url(self, href: str, base_url: str) -> str:
+        """Resolve an application link against the job page's domain"""
+        if href.startswith('http'):
+            return href
+        # Convert relative URL to absolute
+        parsed_base = _urlparse(base_url)
+        domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
+        return urljoin(domain, href)
     
-    def save_results(self):
-        """Save successes, retries, and failures to separate files"""
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        safe_company_name = re.sub(r'[^\w\s-]', '', self.company_name).replace(' ', '_')
+    @staticmethod
+    def _declared_encoding(resp: requests.Response) -> Optional[str]:
+        """
+        Charset from the Content-Type header, if the server sent one
+        Otherwise None, so the parser sniffs <meta charset> from the bytes instead
+        of requests' ISO-8859-1 default or a chardet pass over the whole body
+        """
+        if 'charset' in resp.headers.get('Content-Type', '').lower():
+            return resp.encoding
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=200_000)
+    def _extract_job_id(url: str) -> str:
+        """
+        Extract job ID from URL, handling query parameters correctly
+        Memoized: the same URL is seen by the sample check, pagination, dedup,
+        detail fetching and every failure record. Bounded so a long batch run
+        over many companies doesn't keep every URL alive
+        """
+        # Last path segment before any query string, found by index scans
+        # instead of split/rstrip copies
+        end = url.find('?')
+        if end == -1:
+            end = len(url)
+        while end > 0 and url[end - 1] == '/':
+            end -= 1
+        return url[url.rfind('/', 0, end) + 1:end]
+    
+    def save_results(self, timestamp: Optional[str] = None):
+        """
+        Save successes, retries, and failures to separate files
+        timestamp lets a batch run stamp every company's files with one value
+        """
+        timestamp = timestamp or _file_timestamp()
+        safe_company_name = _safe_name(self.company_name)
         
         files_saved = []
         
         # Save successes
         if self.successes:
             success_file = f'success_{safe_company_name}_{timestamp}.jsonl'
-            with open(success_file, 'w', encoding='utf-8') as f:
-                for success in self.successes:
-                    f.write(json.dumps(asdict(success), ensure_ascii=False) + '\n')
+            _write_jsonl(success_file, self.successes)
             logger.info(f"✓ Saved {len(self.successes)} successful URLs to {success_file}")
             files_saved.append(success_file)
         
         # Save retries
         if self.retries:
             retry_file = self.retries_dir / f'retry_{safe_company_name}_{timestamp}.jsonl'
-            with open(retry_file, 'w', encoding='utf-8') as f:
-                for retry in self.retries:
-                    f.write(json.dumps(asdict(retry), ensure_ascii=False) + '\n')
+            _write_jsonl(retry_file, self.retries)
             logger.info(f"✓ Saved {len(self.retries)} items for retry to {retry_file}")
             files_saved.append(str(retry_file))
         
         # Save failures
         if self.failures:
             failure_file = self.failures_dir / f'failure_{safe_company_name}_{timestamp}.jsonl'
-            with open(failure_file, 'w', encoding='utf-8') as f:
-                for failure in self.failures:
-                    f.write(json.dumps(asdict(failure), ensure_ascii=False) + '\n')
+            _write_jsonl(failure_file, self.failures)
             logger.info(f"✓ Saved {len(self.failures)} failures to {failure_file}")
             files_saved.append(str(failure_file))
         
         return files_saved
     
-    def _save_failures(self):
+    def _save_failures(self, timestamp: Optional[str] = None):
         """Save all failures to a JSONL file in failures directory"""
         if not self.failures:
             return
             
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        safe_company_name = re.sub(r'[^\w\s-]', '', self.company_name).replace(' ', '_')
+        timestamp = timestamp or _file_timestamp()
+        safe_company_name = _safe_name(self.company_name)
         
         failures_file = self.failures_dir / f'failures_{safe_company_name}_{timestamp}.jsonl'
         
-        with open(failures_file, 'w', encoding='utf-8') as f:
-            for failure in self.failures:
-                f.write(json.dumps(asdict(failure), ensure_ascii=False) + '\n')
+        _write_jsonl(failures_file, self.failures)
         
         logger.info(f"✓ Saved {len(self.failures)} failures to {failures_file}")
         
@@ -1461,21 +2028,15 @@ class AvatureMultiStrategyScraper:
     
     def _save_failure_summary(self, company_name: str, timestamp: str):
         """Create a summary of failures by error type"""
-        summary = {}
+        summary = defaultdict(lambda: {'count': 0, 'examples': []})
         
         for failure in self.failures:
-            error_type = failure.error_type
-            if error_type not in summary:
-                summary[error_type] = {
-                    'count': 0,
-                    'examples': []
-                }
-            
-            summary[error_type]['count'] += 1
+            entry = summary[failure.error_type]
+            entry['count'] += 1
             
             # Keep up to 3 examples per error type
-            if len(summary[error_type]['examples']) < 3:
-                summary[error_type]['examples'].append({
+            if len(entry['examples']) < 3:
+                entry['examples'].append({
                     'url': failure.url,
                     'job_id': failure.job_id,
                     'message': failure.error_message
@@ -1483,47 +2044,121 @@ class AvatureMultiStrategyScraper:
         
         summary_file = self.failures_dir / f'failure_summary_{company_name}_{timestamp}.json'
         
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'company': self.company_name,
-                'total_failures': len(self.failures),
-                'timestamp': timestamp,
-                'breakdown_by_type': summary
-            }, f, indent=2, ensure_ascii=False)
+        summary_doc = {
+            'company': self.company_name,
+            'total_failures': len(self.failures),
+            'timestamp': timestamp,
+            'breakdown_by_type': dict(summary)
+        }
+        _write_json(summary_file, summary_doc)
         
         logger.info(f"✓ Saved failure summary to {summary_file}")
 
 
+def _file_timestamp() -> str:
+    """UTC timestamp used in output file names"""
+    return datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+
+
+def _safe_name(name: str) -> str:
+    """Company name made safe for use in output file names"""
+    return _UNSAFE_NAME_CHARS_RE.sub('', name).replace(' ', '_')
+
+
+@functools.lru_cache(maxsize=None)
+def _record_field_names(record_type: type) -> Tuple[str, ...]:
+    """Field names of a result dataclass, computed once per type"""
+    return tuple(f.name for f in dataclass_fields(record_type))
+
+
+def _write_jsonl(path, records: List) -> None:
+    """Write dataclass records as JSON lines, serialized into one buffer and written once"""
+    if ORJSON_AVAILABLE:
+        buf = bytearray()
+        append = buf.extend
+        for record in records:
+            append(orjson.dumps(record, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_APPEND_NEWLINE))
+        Path(path).write_bytes(buf)
+    else:
+        # Flat dataclasses: read fields directly, no asdict deep copy
+        with open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(
+                json.dumps({name: getattr(record, name) for name in _record_field_names(type(record))},
+                           ensure_ascii=False) + '\n'
+                for record in records
+            )
+
+
+def _write_json(path, doc) -> None:
+    """Write an indented JSON document, encoded in one call and written once"""
+    if ORJSON_AVAILABLE:
+        Path(path).write_bytes(orjson.dumps(
+            doc, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS))
+    else:
+        Path(path).write_text(json.dumps(doc, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def _avature_company_from_url(url: str) -> Optional[str]:
+    """
+    Company subdomain of a plain http(s)://<company>.avature.net URL, found with
+    string scans; None for anything else, which then goes through urlparse
+    """
+    if url.startswith('https://'):
+        start = 8
+    elif url.startswith('http://'):
+        start = 7
+    else:
+        return None
+    
+    end = len(url)
+    for sep in '/?#':
+        i = url.find(sep, start)
+        if i != -1 and i < end:
+            end = i
+    host = url[start:end]
+    
+    # Ports and credentials are left to urlparse
+    if not host.endswith('.avature.net') or ':' in host or '@' in host:
+        return None
+    return host[:-len('.avature.net')] or None
+
+
 def load_companies_from_file(file_path: str) -> List[Tuple[str, str]]:
     """Load companies from a file containing URLs"""
     companies = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue  # Skip empty lines and comments
+        text = Path(file_path).read_text(encoding='utf-8')
+        for line_num, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line[0] == '#':
+                continue  # Skip empty lines and comments
+            
+            # Fast path for the usual https://<company>.avature.net/... line
+            company_name = _avature_company_from_url(line)
+            if company_name:
+                companies.append((company_name, line))
+                continue
+            
+            try:
+                # Parse the URL to extract company name
+                parsed = _urlparse(line)
+                if not parsed.netloc:
+                    logger.warning(f"Invalid URL on line {line_num}: {line}")
+                    continue
                 
-                try:
-                    # Parse the URL to extract company name
-                    parsed = urlparse(line)
-                    if not parsed.netloc:
-                        logger.warning(f"Invalid URL on line {line_num}: {line}")
-                        continue
-                    
-                    # Extract company name from subdomain (e.g., "advocateaurorahealth" from "advocateaurorahealth.avature.net")
-                    if '.avature.net' in parsed.netloc:
-                        company_name = parsed.netloc.replace('.avature.net', '')
-                        companies.append((company_name, line))
-                    else:
-                        logger.warning(f"Non-Avature URL on line {line_num}: {line}")
-                        continue
-                        
-                except Exception as e:
-                    logger.error(f"Error parsing URL on line {line_num} ({line}): {e}")
+                # Extract company name from subdomain (e.g., "advocateaurorahealth" from "advocateaurorahealth.avature.net")
+                if '.avature.net' in parsed.netloc:
+                    company_name = parsed.netloc.replace('.avature.net', '')
+                    companies.append((company_name, line))
+                else:
+                    logger.warning(f"Non-Avature URL on line {line_num}: {line}")
                     continue
                     
+            except Exception as e:
+                logger.error(f"Error parsing URL on line {line_num} ({line}): {e}")
+                continue
+                
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         raise
@@ -1535,22 +2170,102 @@ def load_companies_from_file(file_path: str) -> List[Tuple[str, str]]:
     return companies
 
 
-def save_urls(urls: List[str], company_name: str) -> str:
+def save_urls(urls: List[str], company_name: str, timestamp: Optional[str] = None) -> str:
     """Save URLs to text file"""
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-    safe_company_name = re.sub(r'[^\w\s-]', '', company_name).replace(' ', '_')
+    timestamp = timestamp or _file_timestamp()
+    safe_company_name = _safe_name(company_name)
     
     urls_file = f'urls_{safe_company_name}_{timestamp}.txt'
     
-    with open(urls_file, 'w', encoding='utf-8') as f:
-        for url in urls:
-            f.write(url + '\n')
+    with open(urls_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.writelines(url + '\n' for url in urls)
     
     logger.info(f"✓ Saved {len(urls)} URLs to {urls_file}")
     
     return urls_file
 
 
+@dataclass(frozen=True, slots=True)
+class _RedirectMockScraper:
+    """Stand-in scraper for companies that redirect off Avature, for consistent stats structure"""
+    successes: tuple = ()
+    retries: tuple = ()
+    failures: tuple = ()
+    strategy_used: str = "external_redirect_detected"
+    rss_available: bool = False
+    
+    def save_results(self, timestamp: Optional[str] = None):
+        return []  # No files to save for external redirects
+
+
+_REDIRECT_MOCK = _RedirectMockScraper()
+
+
+def _process_company(company_name: str, base_url: str, max_workers: int, fast_mode: bool,
+                     io_pool: ThreadPoolExecutor, timestamp: str) -> Optional[Tuple[List[str], Dict, Future]]:
+    """
+    Collect one company's job URLs and queue its result files on io_pool
+    Returns the URLs, the company's stats entry and the future for the saved
+    file list, or None if it failed outright
+    """
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Processing: {company_name}")
+    logger.info(f"{'='*60}\n")
+    
+    try:
+        scraper = AvatureMultiStrategyScraper(
+            company_name=company_name,
+            base_url=base_url,
+            max_workers=max_workers,
+            fast_mode=fast_mode
+        )
+        
+        start_time = time.time()
+        urls = scraper.scrape_all_job_urls()
+        elapsed = time.time() - start_time
+        
+    except Exception as e:
+        if _EXTERNAL_REDIRECT_PREFIX in str(e):
+            # Handle external redirect gracefully
+            logger.error(f"{'='*60}")
+            logger.error(f"REDIRECT FAILURE: {company_name}")
+            logger.error(f"Original URL: {base_url}")
+            logger.error(f"Reason: {str(e).replace(_EXTERNAL_REDIRECT_PREFIX, '')}")
+            logger.error(f"{'='*60}\n")
+            
+            # Use the mock scraper for stats recording
+            elapsed = 0
+            urls = []
+            scraper = _REDIRECT_MOCK
+        else:
+            logger.error(f"Unexpected error processing {company_name}: {e}")
+            return None
+    finally:
+        # WAF solves for this company ran on this thread; its browser is closed here
+        AvatureMultiStrategyScraper._close_shared_browser()
+    
+    # Save categorized results off the scraping thread; each company writes its own files
+    saved_files = io_pool.submit(scraper.save_results, timestamp)
+    
+    company_stats = {
+        'urls_found': len(urls),
+        'successes': len(scraper.successes),
+        'retries': len(scraper.retries),
+        'failures': len(scraper.failures),
+        'time_seconds': round(elapsed, 2),
+        'urls_per_second': round(len(urls) / elapsed, 2) if elapsed > 0 else 0,
+        'strategy_used': scraper.strategy_used,
+        'rss_available': scraper.rss_available,
+        'files_saved': []
+    }
+    
+    logger.info(f"\n✓ {company_name}: {len(urls)} URLs in {elapsed:.2f}s")
+    logger.info(f"  Strategy: {scraper.strategy_used}")
+    logger.info(f"  Successes: {len(scraper.successes)}, Retries: {len(scraper.retries)}, Failures: {len(scraper.failures)}")
+    
+    return urls, company_stats, saved_files
+
+
 def main():
     """Main execution"""
     parser = argparse.ArgumentParser(
@@ -1573,6 +2288,19 @@ def main():
         help='Maximum number of concurrent workers (default: 5)'
     )
     
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Extract job links from listing pages with a regex scan instead of parsing the HTML'
+    )
+    
+    parser.add_argument(
+        '--parallel-companies',
+        type=int,
+        default=1,
+        help='Number of companies to collect concurrently (default: 1)'
+    )
+    
     args = parser.parse_args()
     
     # Load companies from file
@@ -1586,102 +2314,49 @@ def main():
         logger.error("No valid companies found in the file")
         return
     
-    all_urls = []
+    total_urls = 0
     stats = {}
     
-    for company_name, base_url in companies:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing: {company_name}")
-        logger.info(f"{'='*60}\n")
-        
-        # Use command line argument for workers (removed Bloomberg special case since we're not fetching pages)
-        max_workers = args.max_workers
-        
-        try:
-            scraper = AvatureMultiStrategyScraper(
-                company_name=company_name,
-                base_url=base_url,
-                max_workers=max_workers
+    # The combined file is written as each company finishes rather than from one
+    # big in-memory list at the end
+    timestamp = _file_timestamp()
+    combined_file = f'urls_all_companies_{timestamp}.txt'
+    
+    # Companies live on different hosts, so they can be collected side by side;
+    # each one still paces its own requests. Results are merged in input order
+    saved_files_futures = {}
+    with ThreadPoolExecutor(max_workers=2) as io_pool, \
+            open(combined_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as combined_fh:
+        with ThreadPoolExecutor(max_workers=max(1, args.parallel_companies)) as executor:
+            results = executor.map(
+                lambda company: _process_company(company[0], company[1], args.max_workers, args.fast, io_pool, timestamp),
+                companies
             )
-            
-            start_time = time.time()
-            urls = scraper.scrape_all_job_urls()
-            elapsed = time.time() - start_time
-            
-            all_urls.extend(urls)
-            
-        except Exception as e:
-            if "external_redirect:" in str(e):
-                # Handle external redirect gracefully
-                logger.error(f"{'='*60}")
-                logger.error(f"REDIRECT FAILURE: {company_name}")
-                logger.error(f"Original URL: {base_url}")
-                logger.error(f"Reason: {str(e).replace('external_redirect: ', '')}")
-                logger.error(f"{'='*60}\n")
-                
-                # Create mock scraper for stats recording
-                elapsed = 0
-                urls = []
-                
-                # Create a mock scraper object for consistent stats structure
-                class MockScraper:
-                    def __init__(self):
-                        self.successes = []
-                        self.retries = []
-                        self.failures = []
-                        self.strategy_used = "external_redirect_detected"
-                        self.rss_available = False
-                    
-                    def save_results(self):
-                        return []  # No files to save for external redirects
-                
-                scraper = MockScraper()
-            else:
-                logger.error(f"Unexpected error processing {company_name}: {e}")
-                continue
-        
-        # Save categorized results
-        saved_files = scraper.save_results()
-        
-        stats[company_name] = {
-            'urls_found': len(urls),
-            'successes': len(scraper.successes),
-            'retries': len(scraper.retries),
-            'failures': len(scraper.failures),
-            'time_seconds': round(elapsed, 2),
-            'urls_per_second': round(len(urls) / elapsed, 2) if elapsed > 0 else 0,
-            'strategy_used': scraper.strategy_used,
-            'rss_available': scraper.rss_available,
-            'files_saved': saved_files
-        }
+            for company_name, result in zip((name for name, _ in companies), results):
+                if result is None:
+                    continue
+                urls, stats[company_name], saved_files_futures[company_name] = result
+                combined_fh.writelines(url + '\n' for url in urls)
+                total_urls += len(urls)
         
-        logger.info(f"\n✓ {company_name}: {len(urls)} URLs in {elapsed:.2f}s")
-        logger.info(f"  Strategy: {scraper.strategy_used}")
-        logger.info(f"  Successes: {len(scraper.successes)}, Retries: {len(scraper.retries)}, Failures: {len(scraper.failures)}")
+        for company_name, future in saved_files_futures.items():
+            stats[company_name]['files_saved'] = future.result()
     
     # Save combined results
     logger.info(f"\n{'='*60}")
     logger.info("SAVING COMBINED RESULTS")
     logger.info(f"{'='*60}\n")
     
-    timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-    combined_file = f'urls_all_companies_{timestamp}.txt'
-    
-    with open(combined_file, 'w', encoding='utf-8') as f:
-        for url in all_urls:
-            f.write(url + '\n')
-    
-    logger.info(f"✓ Saved {len(all_urls)} total URLs to {combined_file}")
+    logger.info(f"✓ Saved {total_urls} total URLs to {combined_file}")
     
     # Save statistics
     stats_file = f'url_collection_stats_{timestamp}.json'
-    with open(stats_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'total_urls': len(all_urls),
-            'total_companies': len(companies),
-            'timestamp': datetime.utcnow().isoformat(),
-            'companies': stats
-        }, f, indent=2)
+    _write_json(stats_file, {
+        'total_urls': total_urls,
+        'total_companies': len(companies),
+        'timestamp': datetime.utcnow().isoformat(),
+        'companies': stats
+    })
     
     logger.info(f"✓ Saved statistics to {stats_file}")
     
@@ -1689,7 +2364,7 @@ def main():
     print("\n" + "="*60)
     print("FINAL SUMMARY")
     print("="*60)
-    print(f"Total URLs collected: {len(all_urls)}")
+    print(f"Total URLs collected: {total_urls}")
     print(f"Total companies: {len(companies)}")
     print("\nBreakdown by company:")
     for company, data in stats.items():
@@ -14,13 +14,22 @@ Example:
 
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 from job_url_extractor import AvatureMultiStrategyScraper
 import requests
 from dataclasses import dataclass
 from typing import Optional, List
 from enum import Enum
 
+# Batch runs parse the same career and redirect URLs repeatedly
+_urlparse = lru_cache(maxsize=8192)(urlparse)
+
+# Error message fragments used to categorize failures
+_NO_JOBS_MARKERS = ("No job listings found", "0 jobs")
+_NETWORK_ERROR_MARKERS = ("timeout", "connection")
+
 class FailureCategory(Enum):
     LEGITIMATE_NO_JOBS = "legitimate_no_jobs"  # Site exists but has no jobs
     SITE_NOT_FOUND = "site_not_found"          # 404, site doesn't exist
@@ -45,6 +54,48 @@ def categorize_failure(url: str, error_msg: str, http_status: Optional[int], red
     """
     Automatically categorize failure types based on response patterns
     """
+    return _categorize_failure_cached(
+        url, http_status, redirected_url,
+        any(marker in error_msg for marker in _NO_JOBS_MARKERS),
+        any(marker in error_msg.lower() for marker in _NETWORK_ERROR_MARKERS),
+    )
+
+def categorize_scraper_failures(scraper: AvatureMultiStrategyScraper, career_url: str) -> FailureCategory:
+    """
+    Categorize all of a scraper's failures in a single pass, memoized on the scraper
+    """
+    failures = scraper.failures
+    cached = getattr(scraper, '_failure_category', None)
+    if cached is not None and cached[0] == len(failures):
+        return cached[1]
+    
+    http_status = None
+    no_jobs = network_error = False
+    for failure in failures:
+        if http_status is None and failure.http_status:
+            http_status = failure.http_status
+        msg = failure.error_message or ''
+        if not no_jobs and any(marker in msg for marker in _NO_JOBS_MARKERS):
+            no_jobs = True
+        if not network_error:
+            msg_lower = msg.lower()
+            network_error = any(marker in msg_lower for marker in _NETWORK_ERROR_MARKERS)
+    
+    if http_status is None:
+        category = FailureCategory.LEGITIMATE_NO_JOBS
+    else:
+        category = _categorize_failure_cached(
+            career_url, http_status,
+            scraper.base_url if scraper.base_url != career_url else None,
+            no_jobs, network_error,
+        )
+    scraper._failure_category = (len(failures), category)
+    return category
+
+@lru_cache(maxsize=1024)
+def _categorize_failure_cached(url: str, http_status: Optional[int], redirected_url: Optional[str],
+                               no_jobs: bool, network_error: bool) -> FailureCategory:
+    """categorize_failure body, memoized on its (hashable) arguments"""
     if http_status == 404:
         return FailureCategory.SITE_NOT_FOUND
     
@@ -53,16 +104,15 @@ def categorize_failure(url: str, error_msg: str, http_status: Optional[int], red
     
     if redirected_url and redirected_url != url:
         # Check if redirected to completely different domain
-        from urllib.parse import urlparse
-        orig_domain = urlparse(url).netloc
-        redir_domain = urlparse(redirected_url).netloc
+        orig_domain = _urlparse(url).netloc
+        redir_domain = _urlparse(redirected_url).netloc
         if orig_domain != redir_domain and 'avature.net' not in redir_domain:
             return FailureCategory.SITE_MOVED
     
-    if "No job listings found" in error_msg or "0 jobs" in error_msg:
+    if no_jobs:
         return FailureCategory.LEGITIMATE_NO_JOBS
     
-    if "timeout" in error_msg.lower() or "connection" in error_msg.lower():
+    if network_error:
         return FailureCategory.TECHNICAL_ERROR
     
     return FailureCategory.UNKNOWN
@@ -78,14 +128,12 @@ def validate_extraction(career_url: str, expected_count: int) -> ValidationResul
     Returns:
         ValidationResult with detailed categorization
     """
-    from urllib.parse import urlparse
-    
     print(f"Testing URL extraction from: {career_url}")
     print(f"Expected job count: {expected_count}")
     print("-" * 60)
     
     # Extract company name from URL
-    parsed = urlparse(career_url)
+    parsed = _urlparse(career_url)
     company_name = parsed.netloc.split('.')[0] if parsed.netloc else "unknown"
     
     try:
@@ -123,19 +171,7 @@ def validate_extraction(career_url: str, expected_count: int) -> ValidationResul
             # Categorize based on results
             if actual_count == 0:
                 if scraper.failures:
-                    # Analyze failures to categorize
-                    error_msgs = [f.error_message for f in scraper.failures]
-                    http_statuses = [f.http_status for f in scraper.failures if f.http_status]
-                    
-                    if http_statuses:
-                        category = categorize_failure(
-                            career_url, 
-                            '; '.join(error_msgs), 
-                            http_statuses[0],
-                            scraper.base_url if scraper.base_url != career_url else None
-                        )
-                    else:
-                        category = FailureCategory.LEGITIMATE_NO_JOBS
+                    category = categorize_scraper_failures(scraper, career_url)
                 else:
                     category = FailureCategory.LEGITIMATE_NO_JOBS
             else:
@@ -208,6 +244,8 @@ def run_validation_suite():
     
     results = []
     
+    # Sequential so each test's output stays under its header; every case is on
+    # a different host, so no delay is needed between them
     for i, (url, expected, description) in enumerate(test_cases, 1):
         print(f"Test {i}/{len(test_cases)}: {description}")
         print("-" * 80)
@@ -216,13 +254,6 @@ def run_validation_suite():
         results.append((description, result))
         
         print()
-        
-        # Add delay between tests to avoid rate limiting
-        if i < len(test_cases):
-            print("Waiting 5 seconds before next test...")
-            import time
-            time.sleep(5)
-            print()
     
     # Summary
     print("="*80)
@@ -6,19 +6,30 @@ Command-line interface for extracting job details from Avature ATS URLs
 
 import argparse
 import logging
+import os
+import signal
 import time
 import sys
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict
+from urllib.parse import urlparse
 
-# Add scraper directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent / 'scraper'))
+# Run as a plain script (python scraper/extract_job_details.py), the package
+# root is not importable; `python -m scraper.extract_job_details` needs no help
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from scraper.job_details_extractor import AvatureJobDetailsExtractor
+# The extractor and job cache (requests, bs4) are imported in main() only once
+# extraction is certain, so --check-retry-file and --stats-only start quickly
 from scraper.url_processor import URLProcessor
 from scraper.output_manager import OutputManager
 from scraper.retry_manager import RetryManager
 
+# Typical time for one job page fetch and parse, used for the timing estimate
+_TYPICAL_PAGE_LATENCY = 0.5
+
 
 def setup_logging(verbose: bool = False, log_file: str = None):
     """Setup logging configuration"""
@@ -52,28 +63,21 @@ def setup_logging(verbose: bool = False, log_file: str = None):
 
 def validate_input_file(input_file: str) -> bool:
     """Validate input file exists and is readable"""
-    if not Path(input_file).exists():
-        print(f"❌ Error: Input file not found: {input_file}")
-        return False
+    input_path = Path(input_file)
     
-    if not Path(input_file).is_file():
-        print(f"❌ Error: Input path is not a file: {input_file}")
+    # is_file() is False for missing paths too; only tell the cases apart on failure
+    if not input_path.is_file():
+        if not input_path.exists():
+            print(f"❌ Error: Input file not found: {input_file}")
+        else:
+            print(f"❌ Error: Input path is not a file: {input_file}")
         return False
     
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            f.read(1)  # Try to read first character
-        return True
-    except Exception as e:
-        print(f"❌ Error: Cannot read input file: {e}")
+    if not os.access(input_path, os.R_OK):
+        print(f"❌ Error: Cannot read input file: {input_file}")
         return False
-
-
-def print_extraction_progress(current: int, total: int, jobs_extracted: int, failures: int):
-    """Print progress information"""
-    percentage = (current / total * 100) if total > 0 else 0
-    print(f"Progress: {current}/{total} ({percentage:.1f}%) | "
-          f"Extracted: {jobs_extracted} | Failed: {failures}")
+    
+    return True
 
 
 def main():
@@ -137,6 +141,10 @@ Supported Input Formats:
                       help='Suppress progress output')
     parser.add_argument('--no-retries', action='store_true',
                       help='Do not generate retry files for failures')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='Fetch every URL, ignoring previously extracted jobs')
+    parser.add_argument('--cache-ttl-days', type=float, default=7,
+                      help='Reuse cached job details younger than this many days (default: 7)')
     
     # Advanced options
     parser.add_argument('--check-retry-file', action='store_true',
@@ -184,33 +192,39 @@ Supported Input Formats:
         print(f"📁 Processing input file: {args.input}")
         start_time = time.time()
         
-        urls = url_processor.process_input_file(args.input, args.company)
+        if args.limit:
+            # Stop reading the input as soon as the limit is reached
+            urls = list(islice(url_processor.iter_input_file(args.input, args.company), args.limit))
+        else:
+            urls = url_processor.process_input_file(args.input, args.company)
         
         if not urls:
             print("❌ No valid URLs found in input file")
             return 1
         
-        # Apply limit if specified
-        if args.limit and args.limit < len(urls):
-            urls = urls[:args.limit]
+        if args.limit and len(urls) == args.limit:
             print(f"🔢 Limited to first {args.limit} URLs for testing")
         
         # Show URL statistics
-        url_stats = url_processor.get_url_statistics(urls)
+        url_stats = url_processor.get_url_summary(urls)
         print(f"\n📊 URL Statistics:")
         print(f"   Total URLs: {url_stats['total_urls']}")
         print(f"   Unique URLs: {url_stats['unique_urls']}")
         print(f"   Unique companies: {url_stats['unique_companies']}")
-        print(f"   Companies: {', '.join(list(url_stats['by_company'].keys())[:5])}")
+        print(f"   Companies: {', '.join(url_stats['companies'][:5])}")
         if url_stats['duplicate_urls'] > 0:
             print(f"   ⚠️  Duplicate URLs: {url_stats['duplicate_urls']}")
         
         if args.stats_only:
             print("\n📈 Company breakdown:")
-            for company, count in sorted(url_stats['by_company'].items(), key=lambda x: x[1], reverse=True):
+            by_company = url_processor.get_company_breakdown(urls)
+            for company, count in sorted(by_company.items(), key=lambda x: x[1], reverse=True):
                 print(f"   {company}: {count} URLs")
             return 0
         
+        from scraper.job_details_extractor import AvatureJobDetailsExtractor
+        from scraper.job_cache import JobCache
+        
         # Initialize extractor
         extractor = AvatureJobDetailsExtractor(
             max_workers=args.max_workers,
@@ -226,16 +240,28 @@ Supported Input Formats:
         print(f"   Request delay: {args.delay}s")
         
         # Provide timing expectations
-        estimated_time_minutes = len(urls) * args.timeout / args.max_workers / 60
+        n_urls = len(urls)
+        progress_interval = min(25, max(10, n_urls // 100))
+        
+        # Requests are paced per host, so throughput is the slower of the worker
+        # pool (typical page latency / workers) and the busiest host's spacing
+        per_host_interval = args.delay + extractor.adaptive_delay
+        busiest_host_urls = max(Counter(urlparse(url_data['url']).hostname for url_data in urls).values())
+        worst_case_seconds = n_urls * args.timeout / args.max_workers
+        estimated_seconds = max(n_urls * _TYPICAL_PAGE_LATENCY / args.max_workers,
+                                busiest_host_urls * per_host_interval)
+        estimated_seconds = min(max(estimated_seconds, n_urls * 0.1 / args.max_workers), worst_case_seconds)
         print(f"\n⏱️   Timing Estimates:")
-        print(f"   Conservative estimate: {estimated_time_minutes:.1f} minutes")
-        print(f"   First progress update: ~{min(25, max(10, len(urls) // 100)) * args.timeout / args.max_workers:.0f} seconds")
-        if len(urls) > 1000:
+        print(f"   Expected: {estimated_seconds / 60:.1f} minutes "
+              f"({busiest_host_urls} URLs on the busiest host at {per_host_interval:.1f}s/request)")
+        print(f"   Worst case (every request times out): {worst_case_seconds / 60:.1f} minutes")
+        print(f"   First progress update: ~{progress_interval * estimated_seconds / n_urls:.0f} seconds")
+        if n_urls > 1000:
             print(f"   ⚠️  Large batch detected - progress updates every 60 seconds minimum")
         
         # Extract job details
-        print(f"\n🔍 Starting extraction of {len(urls)} job URLs...")
-        print(f"💡 Tip: Progress updates every ~60 seconds or {min(25, max(10, len(urls) // 100))} completions")
+        print(f"\n🔍 Starting extraction of {n_urls} job URLs...")
+        print(f"💡 Tip: Progress updates every ~60 seconds or {progress_interval} completions")
         if not args.quiet:
             print(f"📊 Watch for: 📤 Submission → 📊 Progress → 🎉 Completion")
         
@@ -243,15 +269,52 @@ Supported Input Formats:
         
         # Prepare URLs for extraction
         job_urls = [url_data['url'] for url_data in urls]
-        company_name = args.company or (urls[0]['company'] if urls else None)
+        company_name = args.company or urls[0]['company']
+        
+        # Reuse jobs extracted by earlier runs; only new or previously failed URLs are fetched
+        job_cache = None
+        cached_jobs = []
+        if not args.no_cache:
+            job_cache = JobCache(output_manager.cache_dir, ttl_days=args.cache_ttl_days)
+            cached = job_cache.get_many(job_urls)
+            if cached:
+                cached_jobs = list(cached.values())
+                job_urls = [url for url in job_urls if url not in cached]
+                print(f"♻️  Reusing {len(cached_jobs)} cached job details, fetching {len(job_urls)} URLs")
         
         # Progress tracking
         if not args.quiet:
             print("📊 Extraction Progress:")
         
-        jobs, failures = extractor.extract_from_urls(job_urls, company_name)
+        # First Ctrl-C drains the extraction so partial results are still saved;
+        # a second one aborts immediately. That has to be a hard exit: a
+        # KeyboardInterrupt would still wait for the worker threads to finish
+        def handle_sigint(signum, frame):
+            if extractor.stop_requested:
+                print(f"\n❌ Extraction aborted by user", flush=True)
+                os._exit(130)
+            print(f"\n🛑 Interrupt received - finishing in-flight requests and saving partial results "
+                  f"(press Ctrl-C again to abort)")
+            extractor.request_stop()
+        
+        previous_sigint_handler = signal.signal(signal.SIGINT, handle_sigint)
+        try:
+            jobs, failures = extractor.extract_from_urls(job_urls, company_name) if job_urls else ([], [])
+        finally:
+            signal.signal(signal.SIGINT, previous_sigint_handler)
+        interrupted = extractor.stop_requested
+        
+        if job_cache:
+            if jobs:
+                job_cache.put_many(jobs)
+            job_cache.close()
+        jobs = cached_jobs + jobs
         
         extraction_duration = time.time() - extraction_start
+        n_jobs = len(jobs)
+        n_failures = len(failures)
+        n_processed = n_jobs + n_failures
+        success_rate = n_jobs / n_processed if n_processed else 0.0
         
         # Prepare metadata for output
         extraction_metadata = {
@@ -263,8 +326,10 @@ Supported Input Formats:
                 'max_retries': args.max_retries,
                 'request_delay': args.delay
             },
-            'avg_extraction_time': extraction_duration / len(job_urls) if job_urls else 0,
-            'worker_utilization': min(args.max_workers, len(job_urls)),
+            'avg_extraction_time': extraction_duration / n_urls,
+            'worker_utilization': min(args.max_workers, n_urls),
+            'interrupted': interrupted,
+            'cached_jobs': len(cached_jobs),
         }
         
         # Generate outputs
@@ -274,35 +339,44 @@ Supported Input Formats:
             jobs, failures, extraction_metadata, args.output
         )
         
+        # Collect the post-extraction summary and print it in one write
+        summary_lines = []
+        
         # Handle retry files
         if not args.no_retries and failures:
-            retry_stats = retry_manager.process_failures(failures, args.output)
-            print(f"\n🔄 Retry File Statistics:")
-            print(f"   Retryable failures: {retry_stats['retryable']}")
-            print(f"   Rate-limited failures: {retry_stats['rate_limited']}")
-            print(f"   Permanent failures: {retry_stats['permanent']}")
+            retry_stats = retry_manager.process_failures(failures, args.output, interrupted=interrupted)
+            summary_lines.extend([
+                f"\n🔄 Retry File Statistics:",
+                f"   Retryable failures: {retry_stats['retryable']}",
+                f"   Rate-limited failures: {retry_stats['rate_limited']}",
+                f"   Permanent failures: {retry_stats['permanent']}",
+            ])
         
-        # Print summary report
-        print(f"\n" + output_manager.create_extraction_report(jobs, failures, extraction_metadata))
+        # Summary report
+        summary_lines.append(f"\n" + output_manager.create_extraction_report(jobs, failures, extraction_metadata))
         
         # List generated files
-        print(f"\n📄 Generated Files:")
-        for file_type, file_path in files_created.items():
-            print(f"   {file_type}: {file_path}")
+        summary_lines.append(f"\n📄 Generated Files:")
+        summary_lines.extend(f"   {file_type}: {file_path}" for file_type, file_path in files_created.items())
         
         total_time = time.time() - start_time
-        print(f"\n✅ Extraction completed in {total_time:.1f} seconds")
+        summary_lines.append(f"\n✅ Extraction completed in {total_time:.1f} seconds")
+        print("\n".join(summary_lines))
         
         # Return appropriate exit code
-        success_rate = len(jobs) / (len(jobs) + len(failures)) if (len(jobs) + len(failures)) > 0 else 0
-        if success_rate < 0.5:
+        if interrupted:
+            n_skipped = sum(failure.error_type == 'interrupted' for failure in failures)
+            print(f"⚠️  Extraction interrupted - processed {n_processed - n_skipped} of {n_urls} URLs, "
+                  f"{n_skipped} recorded as interrupted")
+            return 130
+        elif success_rate < 0.5:
             print(f"⚠️  Warning: Low success rate ({success_rate:.1%})")
             return 2
         elif failures:
-            print(f"⚠️  Completed with {len(failures)} failures")
+            print(f"⚠️  Completed with {n_failures} failures")
             return 1
         else:
-            print(f"🎉 All {len(jobs)} jobs extracted successfully!")
+            print(f"🎉 All {n_jobs} jobs extracted successfully!")
             return 0
         
     except KeyboardInterrupt:
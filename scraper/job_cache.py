@@ -0,0 +1,72 @@
+"""
+Job Cache for Job Details Extractor
+Persists successfully extracted jobs so re-runs only fetch new or failed URLs
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .job_details_extractor import Job
+
+logger = logging.getLogger(__name__)
+
+# SQLite caps the number of bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+class JobCache:
+    """
+    SQLite-backed cache of extracted jobs keyed by job URL
+    Entries older than the TTL are ignored on lookup and replaced on store
+    """
+    
+    def __init__(self, cache_dir: str, ttl_days: float = 7):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 86400
+        
+        self.db_path = self.cache_dir / "job_details.sqlite3"
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (url TEXT PRIMARY KEY, data TEXT NOT NULL, cached_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Job]:
+        """Return cached, unexpired jobs for the given URLs"""
+        urls = list(urls)
+        min_cached_at = time.time() - self.ttl_seconds
+        cached = {}
+        
+        for start in range(0, len(urls), _LOOKUP_BATCH_SIZE):
+            batch = urls[start:start + _LOOKUP_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self._conn.execute(
+                f"SELECT url, data FROM jobs WHERE cached_at >= ? AND url IN ({placeholders})",
+                (min_cached_at, *batch)
+            )
+            for url, data in rows:
+                try:
+                    cached[url] = Job(**json.loads(data))
+                except (TypeError, ValueError) as e:
+                    logger.debug(f"Ignoring unreadable cache entry for {url}: {e}")
+        
+        return cached
+    
+    def put_many(self, jobs: List[Job]):
+        """Store extracted jobs, replacing any previous entry for the same URL"""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO jobs (url, data, cached_at) VALUES (?, ?, ?)",
+            ((job.url, json.dumps(asdict(job), ensure_ascii=False), now) for job in jobs)
+        )
+        self._conn.commit()
+        logger.info(f"✓ Cached {len(jobs)} job details in {self.db_path}")
+    
+    def close(self):
+        self._conn.close()
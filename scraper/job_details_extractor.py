@@ -4,21 +4,66 @@ Standalone component to extract job details from job URLs
 Based on patterns from hybrid_scraper.py
 """
 
+import copy
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import get_environ_proxies
 import json
 import time
 import logging
 import re
+import socket
+import threading
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional, Set, Tuple, Union
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every job page
+_WORK_LOCATION_RE = re.compile(r'Work Location[:\s]*([^\n]+)', re.IGNORECASE)
+_NAV_BUTTON_TEXT_RE = re.compile(r'Apply\s*Now|Back\s*to|Log\s*In|Save\s*this\s*Job', re.IGNORECASE)
+_BUTTON_CLASS_RE = re.compile(r'button')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Error bodies up to this size are read so the connection can go back to the pool;
+# larger or unsized ones are dropped unread
+_MAX_DRAINED_ERROR_BODY = 64 * 1024
+
+# Page chrome stripped from job descriptions
+_CHROME_TAGS = frozenset({'nav', 'header', 'footer'})
+_BUTTON_TAGS = frozenset({'a', 'button'})
+
+# Phrases marking a closed posting, matched on the raw page bytes in one scan
+_CLOSED_JOB_REASONS = {
+    b'position has been filled': ('position_filled', 'Job page indicates position has been filled'),
+    b'no longer accepting applications': ('applications_closed', 'Job page indicates applications are no longer accepted'),
+    b'this job posting has expired': ('job_expired', 'Job posting has expired'),
+}
+_CLOSED_JOB_RE = re.compile(b'|'.join(map(re.escape, _CLOSED_JOB_REASONS)), re.IGNORECASE)
+
+# Apply link selectors, in order of preference
+_APPLY_SELECTORS = (
+    'a.button.button--primary',
+    'a[href*="Login?jobId"]',
+    'a[href*="Apply"]',
+    'a[data-map="apply-button"]',
+    'a.apply-button',
+)
+
+# Structured field label keywords per metadata key, checked in order
+_METADATA_LABEL_KEYWORDS = (
+    ('date_posted', ('posted date', 'date posted')),
+    ('employment_type', ('employment type', 'job type')),
+    ('department', ('business area', 'department', 'division')),
+)
+
 
 @dataclass
 class Job:
@@ -65,7 +110,7 @@ class JobFailure:
         """Determine if this failure type should be retried"""
         retryable_types = {
             'timeout', 'connection_error', 'rate_limited', 
-            'server_error', 'temporary_error'
+            'server_error', 'temporary_error', 'interrupted'
         }
         retryable_status_codes = {406, 429, 500, 502, 503, 504}
         
@@ -75,6 +120,136 @@ class JobFailure:
         return error_type_check or status_code_check
 
 
+class PerHostTokenBucket:
+    """
+    Thread-safe request pacing with one token bucket per host
+    Buckets refill at one token per interval. Rate-limit response headers
+    (Retry-After, X-RateLimit-Remaining/Reset) can only slow a host down, and
+    only until the server's reset window ends
+    """
+    
+    def __init__(self, capacity: float = 1.0):
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict[str, Optional[float]]] = {}
+    
+    def _state(self, host: str, now: float) -> Dict[str, Optional[float]]:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = {'tokens': self.capacity, 'updated': now, 'interval': None, 'interval_until': None}
+        return state
+    
+    def acquire_blocking(self, host: str, interval: float) -> float:
+        """
+        Take a token for host, sleeping until it is available
+        Tokens are reserved under the lock (the balance may go negative) and
+        the wait happens outside it. Returns the number of seconds slept.
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(host, now)
+            if state['interval'] is not None and now >= state['interval_until']:
+                state['interval'] = state['interval_until'] = None
+            rate = 1.0 / max(state['interval'] or 0.0, interval, 0.001)
+            tokens = min(self.capacity, state['tokens'] + (now - state['updated']) * rate) - 1
+            state['tokens'] = tokens
+            state['updated'] = now
+            wait = -tokens / rate if tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def update(self, host: str, headers) -> None:
+        """Adjust a host's budget from rate-limit response headers"""
+        retry_after = self._parse_retry_after(headers.get('Retry-After'))
+        remaining = self._parse_number(headers.get('X-RateLimit-Remaining'))
+        reset_in = self._parse_reset(headers.get('X-RateLimit-Reset'))
+        
+        if retry_after is None and (remaining is None or reset_in is None):
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(host, now)
+            
+            if retry_after is not None or remaining <= 0:
+                # Leave a single token that only becomes usable once the block ends
+                state['tokens'] = 1.0
+                state['updated'] = max(state['updated'], now + (retry_after if retry_after is not None else reset_in))
+            elif reset_in > 0:
+                # Spread the remaining budget evenly over the reset window, never
+                # faster than the configured spacing (see acquire_blocking)
+                state['interval'] = reset_in / remaining
+                state['interval_until'] = now + reset_in
+    
+    @staticmethod
+    def _parse_number(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    @classmethod
+    def _parse_reset(cls, value: Optional[str]) -> Optional[float]:
+        """X-RateLimit-Reset is either seconds until reset or an epoch timestamp"""
+        reset = cls._parse_number(value)
+        if reset is None:
+            return None
+        if reset > 1_000_000_000:
+            reset -= time.time()
+        return max(reset, 0.0)
+    
+    @classmethod
+    def _parse_retry_after(cls, value: Optional[str]) -> Optional[float]:
+        """Retry-After is either delay seconds or an HTTP date"""
+        if value is None:
+            return None
+        seconds = cls._parse_number(value)
+        if seconds is not None:
+            return max(seconds, 0.0)
+        try:
+            return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return None
+
+
+class AIMDConcurrencyLimiter:
+    """
+    Thread-safe cap on in-flight requests with additive-increase/multiplicative-decrease
+    Throttling responses halve the limit; each full window of successes raises it by one
+    """
+    
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._successes = 0
+        self._cond = threading.Condition()
+    
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+    
+    def release(self, throttled: bool):
+        with self._cond:
+            self._in_flight -= 1
+            if throttled:
+                new_limit = max(1, self.limit // 2)
+                if new_limit < self.limit:
+                    logger.warning(f"⚠️ Throttled: reducing concurrency {self.limit} → {new_limit}")
+                self.limit = new_limit
+                self._successes = 0
+            elif self.limit < self.max_limit:
+                self._successes += 1
+                if self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+
+
 class AvatureJobDetailsExtractor:
     """
     Standalone job details extractor for Avature ATS
@@ -97,6 +272,16 @@ class AvatureJobDetailsExtractor:
             'Upgrade-Insecure-Requests': '1',
         })
         
+        # Size the keep-alive pool to the worker count so threads never open
+        # throwaway connections; retries stay in _fetch_job_detail_with_retry
+        adapter = HTTPAdapter(
+            pool_connections=max(10, self.max_workers),
+            pool_maxsize=max(10, self.max_workers * 4),
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Tracking
         self.jobs_extracted = 0
         self.failures: List[JobFailure] = []
@@ -109,6 +294,19 @@ class AvatureJobDetailsExtractor:
         self.max_adaptive_delay = 5.0  # Maximum adaptive delay
         self.recent_406_count = 0  # Track recent 406 errors
         self.last_request_time = 0  # Track timing for rate limiting
+        self.rate_limiter = PerHostTokenBucket()  # Per-host pacing shared by all workers
+        self.concurrency = AIMDConcurrencyLimiter(max_workers)  # Backs off in-flight requests on throttling
+        
+        # Graceful stop (e.g. on Ctrl-C): no new URLs start, in-flight ones finish
+        self._stop_event = threading.Event()
+    
+    @property
+    def stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+    
+    def request_stop(self):
+        """Stop starting new URLs; extract_from_urls returns once in-flight ones finish"""
+        self._stop_event.set()
     
     def extract_from_urls(self, job_urls: List[str], company_name: str = None) -> Tuple[List[Job], List[JobFailure]]:
         """
@@ -116,6 +314,13 @@ class AvatureJobDetailsExtractor:
         Returns: (successful_jobs, all_failures)
         """
         start_time = time.time()
+        
+        # Order-preserving dedupe: a repeated URL would only cost another request
+        unique_urls = list(dict.fromkeys(job_urls))
+        if len(unique_urls) < len(job_urls):
+            logger.info(f"🧹 Dropped {len(job_urls) - len(unique_urls)} duplicate URLs")
+        job_urls = unique_urls
+        
         logger.info(f"Starting extraction for {len(job_urls)} job URLs")
         logger.info(f"Workers: {self.max_workers}, Timeout: {self.timeout}s, Max retries: {self.max_retries}")
         logger.info(f"Estimated time (conservative): {len(job_urls) * self.timeout / self.max_workers / 60:.1f} minutes")
@@ -124,18 +329,36 @@ class AvatureJobDetailsExtractor:
         failed = 0
         last_progress_time = time.time()
         
+        # Resolve each host once up front: URLs on hosts that do not resolve fail
+        # immediately instead of burning every retry on a connection error
+        unresolvable_hosts = self._find_unresolvable_hosts(job_urls)
+        if unresolvable_hosts:
+            reachable_urls = []
+            for url in job_urls:
+                host = urlparse(url).hostname
+                if host in unresolvable_hosts:
+                    failure = JobFailure(
+                        url=url,
+                        job_id=self._extract_job_id(url),
+                        company=company_name or self._extract_company_from_url(url),
+                        error_type='connection_error',
+                        error_message=f'DNS lookup failed for {host}'
+                    )
+                    self.failures.append(failure)
+                    self.retryable_failures.append(failure)
+                    failed += 1
+                else:
+                    reachable_urls.append(url)
+            logger.warning(f"🌐 {len(unresolvable_hosts)} hosts did not resolve; skipped {failed} URLs")
+            job_urls = reachable_urls
+        
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_url = {}
             
             logger.info(f"📤 Submitting {len(job_urls)} jobs to {self.max_workers} workers...")
             
-            # Submit jobs with enhanced staggered timing to prevent 406 errors
+            # Submit everything up front; request pacing happens in _rate_limited_request
             for i, url in enumerate(job_urls):
-                if i > 0 and i % self.max_workers == 0:
-                    # Longer delay between batches to reduce server load
-                    batch_delay = 0.2 + (self.adaptive_delay * 0.5)  # Scale with adaptive delay
-                    time.sleep(batch_delay)
-                
                 # Progress during submission for large batches
                 if i > 0 and i % 1000 == 0:
                     logger.info(f"📤 Submitted {i}/{len(job_urls)} jobs to workers...")
@@ -150,8 +373,28 @@ class AvatureJobDetailsExtractor:
             logger.info(f"✅ All {len(job_urls)} jobs submitted. Workers are processing...")
             
             # Process results
+            drained = False
             for i, future in enumerate(as_completed(future_to_url), 1):
+                if self._stop_event.is_set() and not drained:
+                    cancelled = sum(f.cancel() for f in future_to_url)
+                    logger.warning(f"🛑 Stop requested: cancelled {cancelled} pending URLs, waiting for in-flight requests")
+                    drained = True
+                
                 url = future_to_url[future]
+                if future.cancelled():
+                    # Never started; recorded so the retry files still cover it
+                    failure = JobFailure(
+                        url=url,
+                        job_id=self._extract_job_id(url),
+                        company=company_name or self._extract_company_from_url(url),
+                        error_type='interrupted',
+                        error_message='Not fetched: extraction was interrupted'
+                    )
+                    self.failures.append(failure)
+                    self.retryable_failures.append(failure)
+                    failed += 1
+                    continue
+                
                 try:
                     result = future.result()
                     if isinstance(result, Job):
@@ -196,10 +439,6 @@ class AvatureJobDetailsExtractor:
                         f"⚡ {rate:.1f}/sec | ETA: {eta_minutes:.1f}min"
                     )
                     last_progress_time = current_time
-                
-                # Enhanced rate limiting to prevent 406 errors
-                processing_delay = max(0.1, self.request_delay * 0.5)  # Minimum 100ms, scale with request delay
-                time.sleep(processing_delay)
         
         total_time = time.time() - start_time
         success_rate = len(jobs) / (len(jobs) + failed) * 100 if (len(jobs) + failed) > 0 else 0
@@ -212,12 +451,37 @@ class AvatureJobDetailsExtractor:
         
         return jobs, self.failures
     
+    def _find_unresolvable_hosts(self, job_urls: List[str]) -> Set[str]:
+        """Resolve every distinct host once, concurrently; return the ones that fail"""
+        hosts = {urlparse(url).hostname for url in job_urls} - {None}
+        
+        # Hosts reached through a proxy are resolved by the proxy, which may know
+        # names local DNS does not, so they are left to the request itself
+        if self.session.proxies:
+            return set()
+        if self.session.trust_env:
+            hosts = {host for host in hosts if not get_environ_proxies(f"https://{host}/")}
+        
+        if not hosts:
+            return set()
+        
+        def resolves(host: str) -> bool:
+            try:
+                socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+                return True
+            except (socket.gaierror, UnicodeError):
+                return False
+        
+        with ThreadPoolExecutor(max_workers=min(16, len(hosts))) as executor:
+            return {host for host, ok in zip(hosts, executor.map(resolves, hosts)) if not ok}
+    
     def _fetch_job_detail_with_retry(self, job_url: str, company_name: str) -> Union[Job, JobFailure]:
         """
         Fetch job details with retry logic and exponential backoff
         Based on hybrid_scraper.py implementation
         """
         job_id = self._extract_job_id(job_url)
+        result = None
         
         for attempt in range(self.max_retries + 1):
             try:
@@ -229,7 +493,13 @@ class AvatureJobDetailsExtractor:
                         base_delay *= 2  # Double delay when we've had recent 406s
                     delay = min(base_delay, 30)  # Cap at 30 seconds (increased from 10)
                     logger.debug(f"Retry {attempt} for {job_url} after {delay}s (recent 406s: {getattr(self, 'recent_406_count', 0)})")
-                    time.sleep(delay)
+                    if self._stop_event.wait(delay):
+                        # Stopping: keep the last (retryable) failure instead of retrying
+                        return result or JobFailure(
+                            url=job_url, job_id=job_id, company=company_name,
+                            error_type='interrupted', error_message='Extraction stopped before retry',
+                            retry_count=attempt
+                        )
                 
                 # Longer timeout for retries
                 timeout = self.timeout + (10 * attempt)
@@ -264,6 +534,17 @@ class AvatureJobDetailsExtractor:
             error_message=f'Failed after {self.max_retries + 1} attempts'
         )
 
+    @staticmethod
+    def _declared_encoding(resp: requests.Response) -> Optional[str]:
+        """
+        Charset from the Content-Type header, if the server sent one
+        Otherwise None, so the parser sniffs <meta charset> from the bytes instead
+        of requests' ISO-8859-1 default or a chardet pass over the whole body
+        """
+        if 'charset' in resp.headers.get('Content-Type', '').lower():
+            return resp.encoding
+        return None
+    
     def _fetch_job_detail(self, job_url: str, company_name: str, timeout: int) -> Union[Job, JobFailure]:
         """
         Fetch complete job details from a job detail page
@@ -320,31 +601,17 @@ class AvatureJobDetailsExtractor:
                     http_status=resp.status_code
                 )
             
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
             # Check for content state indicators - based on hybrid_scraper.py
-            page_text = resp.text.lower()
-            
-            if "position has been filled" in page_text:
+            closed = _CLOSED_JOB_RE.search(resp.content)
+            if closed:
+                error_type, error_message = _CLOSED_JOB_REASONS[closed.group().lower()]
                 return JobFailure(
                     url=job_url, job_id=job_id, company=company_name,
-                    error_type='position_filled', error_message='Job page indicates position has been filled',
+                    error_type=error_type, error_message=error_message,
                     http_status=200
                 )
             
-            if "no longer accepting applications" in page_text:
-                return JobFailure(
-                    url=job_url, job_id=job_id, company=company_name,
-                    error_type='applications_closed', error_message='Job page indicates applications are no longer accepted',
-                    http_status=200
-                )
-            
-            if "this job posting has expired" in page_text:
-                return JobFailure(
-                    url=job_url, job_id=job_id, company=company_name,
-                    error_type='job_expired', error_message='Job posting has expired',
-                    http_status=200
-                )
+            soup = BeautifulSoup(resp.content, 'lxml', from_encoding=self._declared_encoding(resp))
             
             # Extract job fields
             title = self._extract_title(soup)
@@ -355,9 +622,10 @@ class AvatureJobDetailsExtractor:
                     http_status=200
                 )
             
-            location = self._extract_location(soup)
+            fields = self._extract_fields(soup)
+            location = self._extract_location(soup, fields)
             description = self._extract_description(soup)
-            metadata = self._extract_metadata(soup)
+            metadata = self._extract_metadata(soup, fields)
             application_url = self._extract_application_url(soup, job_url)
             
             return Job(
@@ -401,22 +669,40 @@ class AvatureJobDetailsExtractor:
 
     def _rate_limited_request(self, job_url: str, timeout: int):
         """Make a rate-limited request with adaptive delays"""
-        current_time = time.time()
+        # Keyed by hostname so scheme/port variants of one Avature host share a bucket
+        host = urlparse(job_url).hostname
         
-        # Apply base delay plus adaptive delay
+        # Apply base delay plus adaptive delay, per host
         total_delay = self.request_delay + self.adaptive_delay
+        sleep_time = self.rate_limiter.acquire_blocking(host, total_delay)
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: slept {sleep_time:.2f}s before request to {host}")
         
-        # Ensure minimum time between requests
-        if self.last_request_time > 0:
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < total_delay:
-                sleep_time = total_delay - time_since_last
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s before request")
-                time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-        return self.session.get(job_url, timeout=timeout)
+        self.concurrency.acquire()
+        throttled = True  # Timeouts and connection errors also count against the limit
+        try:
+            self.last_request_time = time.time()
+            # Streamed so error pages are judged on the status line alone
+            resp = self.session.get(job_url, timeout=timeout, stream=True)
+            if resp.status_code == 200:
+                resp.content  # Read the page while still holding the concurrency slot
+            else:
+                self._discard_body(resp)
+            throttled = resp.status_code in (406, 429) or resp.status_code >= 500
+        finally:
+            self.concurrency.release(throttled)
+        
+        self.rate_limiter.update(host, resp.headers)
+        return resp
 
+    @staticmethod
+    def _discard_body(resp: requests.Response):
+        """Release a non-200 response without decoding it"""
+        length = resp.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) <= _MAX_DRAINED_ERROR_BODY:
+            resp.content
+        resp.close()
+    
     def _reset_adaptive_delay_if_needed(self):
         """Reset 406 count periodically to avoid permanent rate limiting"""
         if self.jobs_extracted > 0 and self.jobs_extracted % 100 == 0:  # Every 100 successful jobs
@@ -443,21 +729,29 @@ class AvatureJobDetailsExtractor:
         
         return None
 
-    def _extract_location(self, soup: BeautifulSoup) -> str:
-        """Extract job location - enhanced from hybrid_scraper.py"""
-        location = ''
-        
-        # First try structured fields
-        location_fields = soup.find_all('div', class_='article__content__view__field')
-        for field in location_fields:
+    def _extract_fields(self, soup: BeautifulSoup) -> List[Tuple[str, str]]:
+        """Collect (lowercased label, value) pairs from the structured fields in one pass"""
+        fields = []
+        for field in soup.select('div.article__content__view__field'):
             label_elem = field.find('div', class_='article__content__view__field__label')
             value_elem = field.find('div', class_='article__content__view__field__value')
             
             if label_elem and value_elem:
-                label_text = label_elem.get_text(strip=True).lower()
-                if any(keyword in label_text for keyword in ['location', 'work location', 'office location']):
-                    location = value_elem.get_text(strip=True)
-                    break
+                fields.append((label_elem.get_text(strip=True).lower(), value_elem.get_text(strip=True)))
+        
+        return fields
+
+    def _extract_location(self, soup: BeautifulSoup, fields: Optional[List[Tuple[str, str]]] = None) -> str:
+        """Extract job location - enhanced from hybrid_scraper.py"""
+        location = ''
+        
+        # First try structured fields
+        if fields is None:
+            fields = self._extract_fields(soup)
+        for label, value in fields:
+            if 'location' in label:
+                location = value
+                break
         
         # Fallback selectors
         if not location:
@@ -474,7 +768,7 @@ class AvatureJobDetailsExtractor:
         # Pattern matching fallback
         if not location:
             page_text = soup.get_text()
-            work_location_match = re.search(r'Work Location[:\s]*([^\n]+)', page_text, re.IGNORECASE)
+            work_location_match = _WORK_LOCATION_RE.search(page_text)
             if work_location_match:
                 location = work_location_match.group(1).strip()
         
@@ -493,29 +787,36 @@ class AvatureJobDetailsExtractor:
         for selector in desc_selectors:
             elem = soup.select_one(selector)
             if elem:
-                # Create copy to avoid modifying original
-                elem_copy = BeautifulSoup(str(elem), 'html.parser')
-                
-                # Remove navigation and buttons
-                for nav in elem_copy.find_all(['nav', 'header', 'footer']):
-                    nav.decompose()
+                # Copy the subtree to avoid modifying the original, without reparsing it
+                elem_copy = copy.copy(elem)
                 
-                for button in elem_copy.find_all(['a', 'button'], 
-                    string=re.compile(r'Apply\s*Now|Back\s*to|Log\s*In|Save\s*this\s*Job', re.IGNORECASE)):
-                    button.decompose()
-                
-                for button in elem_copy.find_all(['a', 'button'], class_=re.compile(r'button')):
-                    button.decompose()
+                # Remove navigation and buttons, found in one walk over the subtree.
+                # Decomposed in reverse document order so nested matches go before
+                # the ancestors that contain them
+                chrome = [tag for tag in elem_copy.find_all(True) if self._is_description_chrome(tag)]
+                for tag in reversed(chrome):
+                    tag.decompose()
                 
                 text = elem_copy.get_text(separator='\n', strip=True)
-                text = re.sub(r'\n{3,}', '\n\n', text)
+                text = _BLANK_LINES_RE.sub('\n\n', text)
                 
                 if text and len(text) > 50:
                     return text
         
         return None
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+    @staticmethod
+    def _is_description_chrome(tag) -> bool:
+        """Navigation, header/footer, or an apply/back/login/save button"""
+        if tag.name in _CHROME_TAGS:
+            return True
+        if tag.name not in _BUTTON_TAGS:
+            return False
+        if tag.string and _NAV_BUTTON_TEXT_RE.search(tag.string):
+            return True
+        return bool(_BUTTON_CLASS_RE.search(' '.join(tag.get('class', []))))
+    
+    def _extract_metadata(self, soup: BeautifulSoup, fields: Optional[List[Tuple[str, str]]] = None) -> Dict[str, Optional[str]]:
         """Extract metadata fields - based on hybrid_scraper.py"""
         metadata = {
             'date_posted': None,
@@ -524,40 +825,23 @@ class AvatureJobDetailsExtractor:
         }
         
         # Structured field extraction
-        fields = soup.find_all('div', class_='article__content__view__field')
-        for field in fields:
-            label_elem = field.find('div', class_='article__content__view__field__label')
-            value_elem = field.find('div', class_='article__content__view__field__value')
-            
-            if label_elem and value_elem:
-                label = label_elem.get_text(strip=True).lower()
-                value = value_elem.get_text(strip=True)
-                
-                if any(keyword in label for keyword in ['posted date', 'date posted']):
-                    metadata['date_posted'] = value
-                elif any(keyword in label for keyword in ['employment type', 'job type']):
-                    metadata['employment_type'] = value
-                elif any(keyword in label for keyword in ['business area', 'department', 'division']):
-                    metadata['department'] = value
+        if fields is None:
+            fields = self._extract_fields(soup)
+        for label, value in fields:
+            for key, keywords in _METADATA_LABEL_KEYWORDS:
+                if any(keyword in label for keyword in keywords):
+                    metadata[key] = value
+                    break
         
         return metadata
 
     def _extract_application_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
         """Extract application URL - based on hybrid_scraper.py"""
-        apply_selectors = [
-            'a.button.button--primary',
-            'a[href*="Login?jobId"]',
-            'a[href*="Apply"]',
-            'a[data-map="apply-button"]',
-            'a.apply-button'
-        ]
-        
-        for selector in apply_selectors:
+        for selector in _APPLY_SELECTORS:
             elem = soup.select_one(selector)
-            if elem and elem.get('href'):
-                href = elem.get('href')
-                if any(keyword in href.lower() for keyword in ['apply', 'login?jobid', 'application']):
-                    return urljoin(base_url, href)
+            href = elem.get('href') if elem else None
+            if href and any(keyword in href.lower() for keyword in ['apply', 'login?jobid', 'application']):
+                return urljoin(base_url, href)
         
         return None
 
@@ -569,16 +853,21 @@ class AvatureJobDetailsExtractor:
     def _extract_company_from_url(self, url: str) -> str:
         """Extract company name from Avature URL"""
         try:
-            parsed = urlparse(url)
-            # For Avature URLs like "company.avature.net"
-            hostname_parts = parsed.hostname.split('.')
-            if 'avature' in hostname_parts:
-                # Get the subdomain before 'avature'
-                avature_index = hostname_parts.index('avature')
-                if avature_index > 0:
-                    return hostname_parts[avature_index - 1]
-            
-            # Fallback to first part of hostname
-            return hostname_parts[0] if hostname_parts else 'unknown'
+            return self._company_from_host(urlparse(url).hostname)
         except:
-            return 'unknown'
\ No newline at end of file
+            return 'unknown'
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _company_from_host(hostname: str) -> str:
+        """Company name for a hostname; a batch usually spans only a few hosts"""
+        # For Avature URLs like "company.avature.net"
+        hostname_parts = hostname.split('.')
+        if 'avature' in hostname_parts:
+            # Get the subdomain before 'avature'
+            avature_index = hostname_parts.index('avature')
+            if avature_index > 0:
+                return hostname_parts[avature_index - 1]
+        
+        # Fallback to first part of hostname
+        return hostname_parts[0] if hostname_parts else 'unknown'
\ No newline at end of file
@@ -3,18 +3,50 @@ Output Manager for Job Details Extractor
 Handles structured output generation and file management
 """
 
+from __future__ import annotations
+
 import json
 import logging
 import re
-from typing import List, Dict, Optional, Set
+from typing import TYPE_CHECKING, List, Dict, Optional, Set
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
-from .job_details_extractor import Job, JobFailure
+if TYPE_CHECKING:
+    # Annotations only: importing the extractor pulls in requests and bs4
+    from .job_details_extractor import Job, JobFailure
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_REPEATED_UNDERSCORES_RE = re.compile(r'_{2,}')
+
+
+def serialize_json(obj, pretty: bool = True) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes, indented or as a single newline-terminated line
+    Uses orjson when installed, otherwise the stdlib json module
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else orjson.OPT_APPEND_NEWLINE)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return (json.dumps(obj, ensure_ascii=False) + '\n').encode('utf-8')
+
+
+def write_file(file_path: Path, content: bytes):
+    """Write fully serialized content with a single write call"""
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
 
 class OutputManager:
     """
@@ -31,15 +63,17 @@ class OutputManager:
             self.retries_dir = self.output_dir / "retries"
             self.failures_dir = self.output_dir / "failures"
             self.logs_dir = self.output_dir / "logs"
+            self.cache_dir = self.output_dir / "cache"
             
             # Create directories
-            for dir_path in [self.job_details_dir, self.retries_dir, self.failures_dir, self.logs_dir]:
+            for dir_path in [self.job_details_dir, self.retries_dir, self.failures_dir, self.logs_dir, self.cache_dir]:
                 dir_path.mkdir(parents=True, exist_ok=True)
         else:
             self.job_details_dir = self.output_dir
             self.retries_dir = self.output_dir
             self.failures_dir = self.output_dir
             self.logs_dir = self.output_dir
+            self.cache_dir = self.output_dir
     
     def save_extraction_results(self, 
                               jobs: List[Job], 
@@ -83,16 +117,19 @@ class OutputManager:
     
     def _save_job_details(self, jobs: List[Job], file_path: Path):
         """Save job details in JSONL format"""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for job in jobs:
-                job_data = asdict(job)
-                # Add extraction metadata
-                job_data['extraction_metadata'] = {
-                    'extracted_at': datetime.utcnow().isoformat(),
-                    'extractor_version': '1.0.0',
-                    'fields_extracted': [key for key, value in job_data.items() if value is not None]
-                }
-                f.write(json.dumps(job_data, ensure_ascii=False) + '\n')
+        extracted_at = datetime.utcnow().isoformat()
+        lines = []
+        for job in jobs:
+            job_data = asdict(job)
+            # Add extraction metadata
+            job_data['extraction_metadata'] = {
+                'extracted_at': extracted_at,
+                'extractor_version': '1.0.0',
+                'fields_extracted': [key for key, value in job_data.items() if value is not None]
+            }
+            lines.append(serialize_json(job_data, pretty=False))
+        
+        write_file(file_path, b''.join(lines))
         
         logger.info(f"✓ Saved {len(jobs)} job details to {file_path}")
     
@@ -107,8 +144,7 @@ class OutputManager:
             'failures': [asdict(failure) for failure in failures]
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(failure_analysis, f, indent=2, ensure_ascii=False)
+        write_file(file_path, serialize_json(failure_analysis))
         
         logger.info(f"✓ Saved {len(failures)} failures with analysis to {file_path}")
     
@@ -149,8 +185,7 @@ class OutputManager:
             }
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        write_file(file_path, serialize_json(stats))
         
         logger.info(f"✓ Saved extraction statistics to {file_path}")
     
@@ -199,8 +234,7 @@ class OutputManager:
             'recommendations': self._generate_recommendations(jobs, failures, metadata)
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        write_file(file_path, serialize_json(summary))
         
         logger.info(f"✓ Saved extraction summary to {file_path}")
     
@@ -375,9 +409,9 @@ class OutputManager:
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for safe file creation"""
         # Remove invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        sanitized = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
         # Remove multiple underscores
-        sanitized = re.sub(r'_{2,}', '_', sanitized)
+        sanitized = _REPEATED_UNDERSCORES_RE.sub('_', sanitized)
         # Trim and ensure not empty
         sanitized = sanitized.strip('_')
         return sanitized if sanitized else 'output'
@@ -3,18 +3,33 @@ Retry Manager for Job Details Extractor
 Handles intelligent retry queue management with backoff strategies
 """
 
+from __future__ import annotations
+
 import json
 import logging
 import time
-from typing import List, Dict, Optional, Set
+from typing import TYPE_CHECKING, List, Dict, Optional, Set
 from dataclasses import asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from .job_details_extractor import JobFailure
+from .output_manager import serialize_json, write_file
+
+if TYPE_CHECKING:
+    # Annotations only: importing the extractor pulls in requests and bs4
+    from .job_details_extractor import JobFailure
 
 logger = logging.getLogger(__name__)
 
+# Retry strategy recommendations by error type
+_RETRY_STRATEGIES = {
+    'timeout': 'Increase timeout, reduce workers',
+    'connection_error': 'Check network, reduce workers',
+    'rate_limited': 'Wait for cooldown period, reduce request rate',
+    'server_error': 'Server issue, exponential backoff',
+    'temporary_error': 'General retry with exponential backoff'
+}
+
 
 class RetryManager:
     """
@@ -31,9 +46,10 @@ class RetryManager:
         self.retry_delays = [300, 600, 1200, 2400, 4800]  # 5min, 10min, 20min, 40min, 80min
         self.rate_limit_cooldown = 1800  # 30 minutes for rate limit errors
         
-    def process_failures(self, failures: List[JobFailure], output_prefix: str) -> Dict[str, int]:
+    def process_failures(self, failures: List[JobFailure], output_prefix: str, interrupted: bool = False) -> Dict[str, int]:
         """
         Process failures and create appropriate retry files
+        interrupted marks files from a run stopped with Ctrl-C
         Returns statistics about failure categorization
         """
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
@@ -61,64 +77,63 @@ class RetryManager:
         # Save retry files
         if retryable_failures:
             retry_file = self.retries_dir / f"retryable_{output_prefix}_{timestamp}.jsonl"
-            self._save_retry_queue(retryable_failures, retry_file, "general")
+            self._save_retry_queue(retryable_failures, retry_file, "general", interrupted)
             logger.info(f"✓ Saved {len(retryable_failures)} retryable failures to {retry_file}")
         
         if rate_limited_failures:
             rate_limit_file = self.retries_dir / f"rate_limited_{output_prefix}_{timestamp}.jsonl"
-            self._save_retry_queue(rate_limited_failures, rate_limit_file, "rate_limited")
+            self._save_retry_queue(rate_limited_failures, rate_limit_file, "rate_limited", interrupted)
             logger.info(f"✓ Saved {len(rate_limited_failures)} rate-limited failures to {rate_limit_file}")
         
         # Save permanent failures for analysis (not retryable)
         if permanent_failures:
             permanent_file = self.retries_dir / f"permanent_failures_{output_prefix}_{timestamp}.jsonl"
-            self._save_failure_analysis(permanent_failures, permanent_file)
+            self._save_failure_analysis(permanent_failures, permanent_file, interrupted)
             logger.info(f"✓ Saved {len(permanent_failures)} permanent failures to {permanent_file}")
         
         return stats
     
-    def _save_retry_queue(self, failures: List[JobFailure], file_path: Path, retry_type: str):
+    def _save_retry_queue(self, failures: List[JobFailure], file_path: Path, retry_type: str, interrupted: bool = False):
         """Save failures to retry queue with metadata"""
         retry_queue = {
             'metadata': {
                 'created_at': datetime.utcnow().isoformat(),
                 'retry_type': retry_type,
+                'interrupted': interrupted,
                 'total_items': len(failures),
                 'next_retry_time': self._calculate_next_retry_time(retry_type),
                 'retry_instructions': self._get_retry_instructions(retry_type)
             },
-            'failures': []
-        }
-        
-        for failure in failures:
-            retry_item = {
-                **asdict(failure),
-                'retry_metadata': {
-                    'original_failure_time': failure.timestamp,
-                    'retry_attempt': failure.retry_count + 1,
-                    'max_retries': self.max_retry_attempts,
-                    'recommended_delay': self._get_retry_delay(failure.retry_count, retry_type),
-                    'retry_strategy': self._get_retry_strategy(failure.error_type)
+            'failures': [
+                {
+                    **asdict(failure),
+                    'retry_metadata': {
+                        'original_failure_time': failure.timestamp,
+                        'retry_attempt': failure.retry_count + 1,
+                        'max_retries': self.max_retry_attempts,
+                        'recommended_delay': self._get_retry_delay(failure.retry_count, retry_type),
+                        'retry_strategy': self._get_retry_strategy(failure.error_type)
+                    }
                 }
-            }
-            retry_queue['failures'].append(retry_item)
+                for failure in failures
+            ]
+        }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(retry_queue, f, indent=2, ensure_ascii=False)
+        write_file(file_path, serialize_json(retry_queue))
     
-    def _save_failure_analysis(self, failures: List[JobFailure], file_path: Path):
+    def _save_failure_analysis(self, failures: List[JobFailure], file_path: Path, interrupted: bool = False):
         """Save permanent failures with analysis"""
         analysis = {
             'metadata': {
                 'created_at': datetime.utcnow().isoformat(),
+                'interrupted': interrupted,
                 'total_failures': len(failures),
                 'failure_summary': self._analyze_failure_patterns(failures)
             },
             'failures': [asdict(failure) for failure in failures]
         }
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2, ensure_ascii=False)
+        write_file(file_path, serialize_json(analysis))
     
     def _analyze_failure_patterns(self, failures: List[JobFailure]) -> Dict:
         """Analyze patterns in permanent failures"""
@@ -176,15 +191,7 @@ class RetryManager:
     
     def _get_retry_strategy(self, error_type: str) -> str:
         """Get retry strategy recommendation based on error type"""
-        strategies = {
-            'timeout': 'Increase timeout, reduce workers',
-            'connection_error': 'Check network, reduce workers',
-            'rate_limited': 'Wait for cooldown period, reduce request rate',
-            'server_error': 'Server issue, exponential backoff',
-            'temporary_error': 'General retry with exponential backoff'
-        }
-        
-        return strategies.get(error_type, 'Standard retry with exponential backoff')
+        return _RETRY_STRATEGIES.get(error_type, 'Standard retry with exponential backoff')
     
     def _get_retry_instructions(self, retry_type: str) -> Dict[str, str]:
         """Get human-readable retry instructions"""
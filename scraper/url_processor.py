@@ -5,13 +5,30 @@ Handles multiple input formats and URL validation
 
 import json
 import logging
-from typing import List, Dict, Optional, Union, Iterator
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Optional, Union, Iterator, Iterable
 from pathlib import Path
 from urllib.parse import urlparse
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Job detail page URL shapes, as one alternation
+_JOB_DETAIL_RE = re.compile(r'/JobDetail/|/jobs/\d+|/job/[a-zA-Z0-9-]+|jobId=\d+', re.IGNORECASE)
+
+# Validation and company extraction parse the same URL strings repeatedly
+_urlparse = lru_cache(maxsize=200_000)(urlparse)
+
 
 class URLProcessor:
     """
@@ -27,12 +44,25 @@ class URLProcessor:
             r'/JobDetail/',
             r'/SearchJobs/'
         ]
+        self._avature_re = re.compile('|'.join(self.avature_patterns), re.IGNORECASE)
     
     def process_input_file(self, input_file: str, company_filter: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Process input file and return list of job URLs with metadata
         Returns: [{'url': str, 'company': str, 'source': str, 'metadata': dict}, ...]
         """
+        valid_urls = list(self.iter_input_file(input_file, company_filter))
+        
+        logger.info(f"Processed {len(valid_urls)} valid URLs from {input_file}")
+        
+        return valid_urls
+    
+    def iter_input_file(self, input_file: str, company_filter: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Lazily yield valid job URLs with metadata from an input file
+        Text and JSONL inputs are streamed line by line, so callers that stop
+        early (e.g. --limit) never read the rest of the file
+        """
         input_path = Path(input_file)
         
         if not input_path.exists():
@@ -49,20 +79,30 @@ class URLProcessor:
         
         # Filter by company if specified
         if company_filter:
-            urls = [url for url in urls if company_filter.lower() in url['company'].lower()]
-            logger.info(f"Filtered to {len(urls)} URLs for company: {company_filter}")
+            urls = filter(self._company_matcher(company_filter), urls)
         
         # Validate URLs
-        valid_urls = self._validate_urls(urls)
+        return self._validate_urls(urls)
+    
+    def _company_matcher(self, company_filter: str):
+        """
+        Build a predicate for the (case-insensitive, substring) company filter
+        Inputs hold few distinct companies, so each verdict is memoized per company
+        """
+        company_filter_lower = company_filter.lower()
+        verdicts: Dict[str, bool] = {}
         
-        logger.info(f"Processed {len(valid_urls)} valid URLs from {input_file}")
+        def matches(url_data: Dict[str, str]) -> bool:
+            company = url_data['company']
+            verdict = verdicts.get(company)
+            if verdict is None:
+                verdict = verdicts[company] = company_filter_lower in company.lower()
+            return verdict
         
-        return valid_urls
+        return matches
     
-    def _process_txt_file(self, file_path: Path) -> List[Dict[str, str]]:
+    def _process_txt_file(self, file_path: Path) -> Iterator[Dict[str, str]]:
         """Process plain text file with URLs (one per line)"""
-        urls = []
-        
         with open(file_path, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
@@ -74,7 +114,7 @@ class URLProcessor:
                 # Extract company name from URL
                 company = self._extract_company_from_url(line)
                 
-                urls.append({
+                yield {
                     'url': line,
                     'company': company,
                     'source': 'txt_file',
@@ -82,44 +122,49 @@ class URLProcessor:
                         'line_number': line_num,
                         'file': str(file_path)
                     }
-                })
-        
-        logger.info(f"Read {len(urls)} URLs from text file: {file_path}")
-        return urls
+                }
     
-    def _process_json_file(self, file_path: Path) -> List[Dict[str, str]]:
+    def _process_json_file(self, file_path: Path) -> Iterator[Dict[str, str]]:
         """Process JSONL or JSON file"""
-        urls = []
-        
+        # Detect the format from the first non-empty line instead of reading
+        # the whole file: JSONL starts with a complete object on its own line
+        first_line = ''
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
+            for line in f:
+                first_line = line.strip()
+                if first_line:
+                    break
+        
+        is_jsonl = False
+        if first_line.startswith('{'):
+            try:
+                first_record = _json_loads(first_line)
+                is_jsonl = not (isinstance(first_record, dict) and 'failures' in first_record)
+            except json.JSONDecodeError:
+                pass
+        
+        if first_line.startswith('[') or (first_line.startswith('{') and not is_jsonl):
+            # JSON format (possibly retry file)
+            try:
+                data = _json_loads(file_path.read_bytes())
+            except json.JSONDecodeError:
+                data = None
             
-            # Try to detect format
-            if content.startswith('[') or content.startswith('{') and '"failures"' in content:
-                # JSON format (possibly retry file)
-                data = json.loads(content)
-                
-                if isinstance(data, list):
-                    # Simple JSON array
-                    urls = self._process_json_array(data, file_path)
-                elif 'failures' in data:
+            if isinstance(data, list):
+                # Simple JSON array
+                return iter(self._process_json_array(data, file_path))
+            elif isinstance(data, dict):
+                if 'failures' in data:
                     # Retry file format
-                    urls = self._process_retry_file(data, file_path)
-                else:
-                    # Single JSON object - try to extract URLs
-                    urls = self._extract_urls_from_object(data, file_path)
-            
-            else:
-                # JSONL format
-                urls = self._process_jsonl_file(file_path)
+                    return iter(self._process_retry_file(data, file_path))
+                # Single JSON object - try to extract URLs
+                return iter(self._extract_urls_from_object(data, file_path))
         
-        logger.info(f"Read {len(urls)} URLs from JSON file: {file_path}")
-        return urls
+        # JSONL format
+        return self._process_jsonl_file(file_path)
     
-    def _process_jsonl_file(self, file_path: Path) -> List[Dict[str, str]]:
+    def _process_jsonl_file(self, file_path: Path) -> Iterator[Dict[str, str]]:
         """Process JSONL file (one JSON object per line)"""
-        urls = []
-        
         with open(file_path, 'r', encoding='utf-8') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
@@ -127,16 +172,14 @@ class URLProcessor:
                     continue
                 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     url_data = self._extract_url_from_json_object(data, line_num, file_path)
                     if url_data:
-                        urls.append(url_data)
+                        yield url_data
                 
                 except json.JSONDecodeError as e:
                     logger.warning(f"Invalid JSON on line {line_num} in {file_path}: {e}")
                     continue
-        
-        return urls
     
     def _process_json_array(self, data: List, file_path: Path) -> List[Dict[str, str]]:
         """Process JSON array of URLs or objects"""
@@ -272,9 +315,8 @@ class URLProcessor:
         
         return urls
     
-    def _validate_urls(self, urls: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    def _validate_urls(self, urls: Iterable[Dict[str, str]]) -> Iterator[Dict[str, str]]:
         """Validate and filter URLs"""
-        valid_urls = []
         invalid_count = 0
         
         for url_data in urls:
@@ -295,40 +337,31 @@ class URLProcessor:
                 invalid_count += 1
                 continue
             
-            valid_urls.append(url_data)
+            yield url_data
         
         if invalid_count > 0:
             logger.info(f"Filtered out {invalid_count} invalid URLs")
-        
-        return valid_urls
     
     def _is_valid_url(self, url: str) -> bool:
         """Check if URL is properly formatted"""
         try:
-            result = urlparse(url)
+            result = _urlparse(url)
             return all([result.scheme, result.netloc])
         except:
             return False
     
     def _is_avature_url(self, url: str) -> bool:
         """Check if URL is from Avature platform"""
-        return any(re.search(pattern, url, re.IGNORECASE) for pattern in self.avature_patterns)
+        return self._avature_re.search(url) is not None
     
     def _is_job_detail_url(self, url: str) -> bool:
         """Check if URL is a job detail page"""
-        job_detail_patterns = [
-            r'/JobDetail/',
-            r'/jobs/\d+',
-            r'/job/[a-zA-Z0-9-]+',
-            r'jobId=\d+'
-        ]
-        
-        return any(re.search(pattern, url, re.IGNORECASE) for pattern in job_detail_patterns)
+        return _JOB_DETAIL_RE.search(url) is not None
     
     def _extract_company_from_url(self, url: str) -> str:
         """Extract company name from Avature URL"""
         try:
-            parsed = urlparse(url)
+            parsed = _urlparse(url)
             hostname_parts = parsed.hostname.split('.')
             
             # For Avature URLs like "company.avature.net"
@@ -344,39 +377,30 @@ class URLProcessor:
     
     def get_url_statistics(self, urls: List[Dict[str, str]]) -> Dict[str, any]:
         """Get statistics about processed URLs"""
-        stats = {
-            'total_urls': len(urls),
-            'by_company': {},
-            'by_source': {},
-            'unique_companies': set(),
-            'duplicate_urls': 0
-        }
-        
-        url_set = set()
-        
-        for url_data in urls:
-            url = url_data['url']
-            company = url_data['company']
-            source = url_data['source']
-            
-            # Count duplicates
-            if url in url_set:
-                stats['duplicate_urls'] += 1
-            else:
-                url_set.add(url)
-            
-            # Count by company
-            stats['by_company'][company] = stats['by_company'].get(company, 0) + 1
-            stats['unique_companies'].add(company)
-            
-            # Count by source
-            stats['by_source'][source] = stats['by_source'].get(source, 0) + 1
-        
-        stats['unique_companies'] = len(stats['unique_companies'])
-        stats['unique_urls'] = len(url_set)
+        stats = self.get_url_summary(urls)
+        stats['by_company'] = self.get_company_breakdown(urls)
+        stats['by_source'] = dict(Counter(url_data['source'] for url_data in urls))
         
         return stats
     
+    def get_url_summary(self, urls: List[Dict[str, str]]) -> Dict[str, any]:
+        """Get URL and company totals without building per-company counts"""
+        unique_urls = {url_data['url'] for url_data in urls}
+        # dict keeps first-seen order for listing companies
+        companies = list(dict.fromkeys(url_data['company'] for url_data in urls))
+        
+        return {
+            'total_urls': len(urls),
+            'unique_companies': len(companies),
+            'companies': companies,
+            'duplicate_urls': len(urls) - len(unique_urls),
+            'unique_urls': len(unique_urls)
+        }
+    
+    def get_company_breakdown(self, urls: List[Dict[str, str]]) -> Dict[str, int]:
+        """Count URLs per company"""
+        return dict(Counter(url_data['company'] for url_data in urls))
+    
     def save_processed_urls(self, urls: List[Dict[str, str]], output_file: str):
         """Save processed URLs to JSONL file for debugging"""
         output_path = Path(output_file)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test script for reading the total job count from search page legends
+"""
+import sys
+from pathlib import Path
+
+# Add job URL extractor directory to path
+sys.path.insert(0, str(Path(__file__).parent / 'job_urls_extractor'))
+
+import requests
+from job_url_extractor import AvatureMultiStrategyScraper
+
+def parse_count(html: str):
+    """Run _parse_total_job_count on a canned 200 response"""
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = html.encode('utf-8')
+    # The parser only needs the response, so skip __init__ and its network calls
+    scraper = object.__new__(AvatureMultiStrategyScraper)
+    return scraper._parse_total_job_count(resp)
+
+def test_selector_priority():
+    """The legend selector order decides, not document order"""
+    print("🧪 Testing legend selector priority...")
+    
+    html = ('<h3 class="section__title--3">Top 5 jobs</h3>'
+            '<div class="list-controls__legend">Showing 1-10 of 106 results</div>')
+    count = parse_count(html)
+    assert count == 106, f"Expected 106 from list-controls__legend, got {count}"
+    print("✅ list-controls__legend wins over an earlier section title")
+
+def test_nested_legend_markup():
+    """Legends with nested markup are read in full"""
+    print("🧪 Testing legends with nested markup...")
+    
+    html = '<div class="list-controls__legend"><span>12 jobs</span> of 340 results</div>'
+    count = parse_count(html)
+    assert count == 340, f"Expected 340 from nested legend, got {count}"
+    print("✅ Nested legend markup is not cut short")
+
+def test_plain_legends():
+    """Single-text legends across the known layouts"""
+    print("🧪 Testing plain legends...")
+    
+    cases = [
+        ('<div class="list-controls__legend">Showing 1-10 of 106 results</div>', 106),
+        ('<span class="search__panel__count--span">There are 80 jobs matching</span>', 80),
+        ('<h3 class="section__title--3">999+ jobs</h3>', 999),
+        ('<p>No legend here</p>', None),
+    ]
+    for html, expected in cases:
+        count = parse_count(html)
+        assert count == expected, f"Expected {expected} for {html!r}, got {count}"
+    print("✅ Plain legends parse as before")
+
+def main():
+    """Run all tests"""
+    print("🚀 Running Job Count Parsing Tests")
+    print("=" * 50)
+    
+    try:
+        test_selector_priority()
+        print()
+        test_nested_legend_markup()
+        print()
+        test_plain_legends()
+        print()
+        print("🎉 All tests passed!")
+        return 0
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())